@@ -87,7 +87,10 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            # Commit each revision on its own so migrations that build
+            # indexes CONCURRENTLY (inside autocommit_block) stay isolated
+            transaction_per_migration=True
         )
 
         with context.begin_transaction():
@@ -31,16 +31,24 @@ def upgrade() -> None:
     # Add message_count column
     op.add_column('chat_sessions', sa.Column('message_count', sa.Integer(), nullable=False, server_default='0'))
 
-    # Update last_message_at and message_count for existing sessions
-    op.execute("""
+    # Update last_message_at and message_count for existing sessions.
+    # The per-session aggregate is materialized server-side into a temp
+    # table first (no client round-trips), analyzed so the planner sees
+    # real row counts, then merged into chat_sessions in one UPDATE.
+    op.execute(sa.text("""
+        CREATE TEMP TABLE session_message_stats ON COMMIT DROP AS
+        SELECT session_id, MAX(created_at) AS max_ts, COUNT(*) AS cnt
+        FROM messages
+        GROUP BY session_id
+    """))
+    op.execute(sa.text("ANALYZE session_message_stats"))
+    op.execute(sa.text("""
         UPDATE chat_sessions cs
-        SET last_message_at = (
-            SELECT MAX(created_at) FROM messages WHERE session_id = cs.id
-        ),
-        message_count = (
-            SELECT COUNT(*) FROM messages WHERE session_id = cs.id
-        )
-    """)
+        SET last_message_at = stats.max_ts,
+            message_count = stats.cnt
+        FROM session_message_stats stats
+        WHERE stats.session_id = cs.id
+    """))
 
     # Create composite index for efficient queries
     op.create_index(
@@ -49,8 +57,14 @@ def upgrade() -> None:
         ['child_id', 'last_message_at']
     )
 
+    # The composite index serves child_id-only lookups via its leftmost prefix
+    op.drop_index('ix_chat_sessions_child_id', table_name='chat_sessions')
+
 
 def downgrade() -> None:
+    # Restore single-column child_id index
+    op.create_index('ix_chat_sessions_child_id', 'chat_sessions', ['child_id'], unique=False)
+
     # Drop composite index
     op.drop_index('ix_chat_sessions_child_last_message', table_name='chat_sessions')
 
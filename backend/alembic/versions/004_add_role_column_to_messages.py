@@ -18,6 +18,9 @@ down_revision: Union[str, None] = '003'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows updated per backfill batch
+BACKFILL_BATCH_SIZE = 30000
+
 
 def upgrade() -> None:
     # Create the messagerole enum type if it doesn't exist
@@ -37,11 +40,47 @@ def upgrade() -> None:
     )
 
     # Set default role for any existing messages without role
-    # Assuming existing messages without a role were user messages
-    op.execute("UPDATE messages SET role = 'user' WHERE role IS NULL")
+    # Assuming existing messages without a role were user messages.
+    # Backfill in committed batches so row locks and WAL stay bounded
+    # instead of rewriting the whole table in one transaction. Rows locked
+    # by another writer are waited for rather than skipped, and the loop
+    # only ends once no NULL role is left, so the constraint validated
+    # below always holds.
+    with op.get_context().autocommit_block():
+        while True:
+            connection.execute(
+                sa.text("""
+                    WITH batch AS (
+                        SELECT id FROM messages
+                        WHERE role IS NULL
+                        LIMIT :batch_size
+                        FOR UPDATE
+                    )
+                    UPDATE messages m
+                    SET role = 'user'
+                    FROM batch
+                    WHERE m.id = batch.id
+                """),
+                {"batch_size": BACKFILL_BATCH_SIZE}
+            )
+            remaining = connection.execute(
+                sa.text("SELECT 1 FROM messages WHERE role IS NULL LIMIT 1")
+            ).first()
+            if remaining is None:
+                break
 
-    # Now make the column NOT NULL
+    # Now make the column NOT NULL. A NOT VALID check is added first and
+    # validated in its own transaction, which scans under a
+    # ShareUpdateExclusiveLock instead of blocking writes; SET NOT NULL
+    # then reuses the proven constraint and skips its own table scan.
+    op.execute(
+        "ALTER TABLE messages ADD CONSTRAINT messages_role_not_null "
+        "CHECK (role IS NOT NULL) NOT VALID"
+    )
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE messages VALIDATE CONSTRAINT messages_role_not_null")
     op.alter_column('messages', 'role', nullable=False)
+    op.drop_constraint('messages_role_not_null', 'messages', type_='check')
 
 
 def downgrade() -> None:
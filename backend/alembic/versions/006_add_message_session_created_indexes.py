@@ -0,0 +1,80 @@
+"""Add composite (session_id, created_at) indexes on message tables
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-11-20
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction; building this way keeps
+    # writes to the message tables flowing while the indexes are created
+    with op.get_context().autocommit_block():
+        # Covering index for "latest messages in session" reads
+        op.create_index(
+            'ix_messages_session_created',
+            'messages',
+            ['session_id', sa.text('created_at DESC')],
+            postgresql_include=['role', 'blocked'],
+            postgresql_concurrently=True
+        )
+
+        # The composite index is a left-prefix superset of the session_id index
+        op.drop_index(
+            'ix_messages_session_id',
+            table_name='messages',
+            postgresql_concurrently=True
+        )
+
+        # Same treatment for parent chat messages
+        op.create_index(
+            'ix_parent_messages_session_created',
+            'parent_messages',
+            ['session_id', sa.text('created_at DESC')],
+            postgresql_include=['role'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_parent_messages_session_id',
+            table_name='parent_messages',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_parent_messages_session_id',
+            'parent_messages',
+            ['session_id'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_parent_messages_session_created',
+            table_name='parent_messages',
+            postgresql_concurrently=True
+        )
+
+        op.create_index(
+            'ix_messages_session_id',
+            'messages',
+            ['session_id'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_messages_session_created',
+            table_name='messages',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,41 @@
+"""Add partial index on unblocked messages
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-11-21
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Chat replay and parent dashboards read only unblocked messages;
+    # leaving blocked rows out keeps this index small. Built CONCURRENTLY
+    # so inserts into messages aren't blocked meanwhile.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_messages_session_created_unblocked',
+            'messages',
+            ['session_id', sa.text('created_at DESC')],
+            postgresql_where=sa.text('blocked = false'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_messages_session_created_unblocked',
+            table_name='messages',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,67 @@
+"""Convert content_rules topics/keywords from JSONB to text[]
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-11-21
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ALTER COLUMN ... USING can't contain a subquery, so unpack the JSON
+    # arrays through a throwaway SQL function
+    op.execute(sa.text("""
+        CREATE FUNCTION tmp_jsonb_to_text_array(value jsonb) RETURNS text[]
+        LANGUAGE sql IMMUTABLE AS $$
+            SELECT coalesce(array_agg(elem), '{}'::text[])
+            FROM jsonb_array_elements_text(value) AS elem
+        $$
+    """))
+    op.execute(
+        "ALTER TABLE content_rules ALTER COLUMN topics TYPE text[] "
+        "USING tmp_jsonb_to_text_array(topics)"
+    )
+    op.execute(
+        "ALTER TABLE content_rules ALTER COLUMN keywords TYPE text[] "
+        "USING tmp_jsonb_to_text_array(keywords)"
+    )
+    op.execute("DROP FUNCTION tmp_jsonb_to_text_array(jsonb)")
+
+    # GIN indexes answer membership checks ('foo' = ANY / @> ARRAY['foo'])
+    op.create_index(
+        'ix_content_rules_topics_gin',
+        'content_rules',
+        ['topics'],
+        postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_content_rules_keywords_gin',
+        'content_rules',
+        ['keywords'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_content_rules_keywords_gin', table_name='content_rules')
+    op.drop_index('ix_content_rules_topics_gin', table_name='content_rules')
+
+    op.execute(
+        "ALTER TABLE content_rules ALTER COLUMN keywords TYPE jsonb "
+        "USING to_jsonb(keywords)"
+    )
+    op.execute(
+        "ALTER TABLE content_rules ALTER COLUMN topics TYPE jsonb "
+        "USING to_jsonb(topics)"
+    )
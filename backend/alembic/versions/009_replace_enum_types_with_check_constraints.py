@@ -0,0 +1,58 @@
+"""Replace native enum types with VARCHAR + CHECK constraints
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-11-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, check constraint name, enum type name, allowed values)
+ENUM_COLUMNS = [
+    ('messages', 'role', 'messages_role_check', 'messagerole', ('user', 'assistant')),
+    ('parent_messages', 'role', 'parent_messages_role_check', 'messagerole', ('user', 'assistant')),
+    ('content_rules', 'mode', 'content_rules_mode_check', 'contentrulemode', ('allowlist', 'blocklist')),
+]
+
+
+def _values_sql(values) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    # Adding a value to a CHECK list is a metadata-only constraint swap,
+    # unlike ALTER TYPE on a native enum
+    for table, column, constraint, _, values in ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(16) "
+            f"USING {column}::text"
+        )
+        op.create_check_constraint(
+            constraint,
+            table,
+            f"{column} IN ({_values_sql(values)})"
+        )
+
+    op.execute("DROP TYPE IF EXISTS messagerole")
+    op.execute("DROP TYPE IF EXISTS contentrulemode")
+
+
+def downgrade() -> None:
+    op.execute("CREATE TYPE messagerole AS ENUM ('user', 'assistant')")
+    op.execute("CREATE TYPE contentrulemode AS ENUM ('allowlist', 'blocklist')")
+
+    for table, column, constraint, type_name, _ in ENUM_COLUMNS:
+        op.drop_constraint(constraint, table, type_='check')
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+            f"USING {column}::{type_name}"
+        )
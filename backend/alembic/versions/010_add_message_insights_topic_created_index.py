@@ -0,0 +1,53 @@
+"""Add covering (topic, created_at) index on message_insights
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-11-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Covering index for per-topic dashboard aggregations over a recent
+        # window, so sums over estimated time are answered from the index
+        op.create_index(
+            'ix_message_insights_topic_created',
+            'message_insights',
+            ['topic', sa.text('created_at DESC')],
+            postgresql_include=['is_learning_question', 'estimated_time_seconds'],
+            postgresql_concurrently=True
+        )
+
+        # Topic-only lookups are served by the new index's leading column
+        op.drop_index(
+            'ix_message_insights_topic',
+            table_name='message_insights',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_message_insights_topic',
+            'message_insights',
+            ['topic'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_message_insights_topic_created',
+            table_name='message_insights',
+            postgresql_concurrently=True
+        )
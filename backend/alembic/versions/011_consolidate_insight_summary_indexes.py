@@ -0,0 +1,88 @@
+"""Consolidate single-column indexes on insight summary tables
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-11-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # "Top topics for this child" filters on child_id and sorts by time;
+        # one composite index serves it without a separate sort
+        op.create_index(
+            'ix_child_topic_summary_child_total_time',
+            'child_topic_summary',
+            ['child_id', sa.text('total_time_seconds DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_child_topic_summary_total_time',
+            table_name='child_topic_summary',
+            postgresql_concurrently=True
+        )
+
+        # child_id lookups are covered by the leading column of
+        # uix_child_topic / uix_child_week
+        op.drop_index(
+            'ix_child_topic_summary_child_id',
+            table_name='child_topic_summary',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_child_weekly_insights_child_id',
+            table_name='child_weekly_insights',
+            postgresql_concurrently=True
+        )
+
+        # Weekly rows are only ever read per child, through uix_child_week
+        op.drop_index(
+            'ix_child_weekly_insights_week_start',
+            table_name='child_weekly_insights',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_child_weekly_insights_week_start',
+            'child_weekly_insights',
+            ['week_start'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_child_weekly_insights_child_id',
+            'child_weekly_insights',
+            ['child_id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_child_topic_summary_child_id',
+            'child_topic_summary',
+            ['child_id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_child_topic_summary_total_time',
+            'child_topic_summary',
+            ['total_time_seconds'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_child_topic_summary_child_total_time',
+            table_name='child_topic_summary',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,78 @@
+"""Generate primary keys server-side with time-ordered uuidv7()
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-11-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose ids were generated client-side with uuid4
+CLIENT_KEYED_TABLES = [
+    'parents',
+    'children',
+    'content_rules',
+    'chat_sessions',
+    'messages',
+    'parent_chat_sessions',
+    'parent_messages',
+]
+
+# Tables that already defaulted to gen_random_uuid() (revision 005)
+SERVER_KEYED_TABLES = [
+    'message_insights',
+    'child_topic_summary',
+    'child_weekly_insights',
+]
+
+
+def upgrade() -> None:
+    # UUIDv7: 48-bit millisecond timestamp followed by random bits, so new
+    # keys land at the right edge of the primary key B-tree. Schema-qualified
+    # because PostgreSQL 18 ships a built-in pg_catalog.uuidv7(), which
+    # unqualified names resolve to first (the column defaults happily use it).
+    op.execute(sa.text("""
+        CREATE OR REPLACE FUNCTION public.uuidv7() RETURNS uuid
+        LANGUAGE sql VOLATILE AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$
+    """))
+
+    for table in CLIENT_KEYED_TABLES + SERVER_KEYED_TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('uuidv7()'))
+
+
+def downgrade() -> None:
+    for table in SERVER_KEYED_TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+    for table in CLIENT_KEYED_TABLES:
+        op.alter_column(table, 'id', server_default=None)
+
+    op.execute("DROP FUNCTION IF EXISTS public.uuidv7()")
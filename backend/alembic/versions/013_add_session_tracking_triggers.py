@@ -0,0 +1,57 @@
+"""Maintain session last_message_at/message_count with triggers
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-11-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (message table, session table, trigger function)
+SESSION_TRACKING = [
+    ('messages', 'chat_sessions', 'bump_chat_session'),
+    ('parent_messages', 'parent_chat_sessions', 'bump_parent_chat_session'),
+]
+
+
+def upgrade() -> None:
+    # Every message insert bumps its session inside Postgres, replacing the
+    # separate UPDATE the API used to issue on each chat turn. created_at is
+    # stamped by the app, so concurrent inserts can land out of order;
+    # GREATEST keeps last_message_at from moving backwards.
+    for message_table, session_table, function in SESSION_TRACKING:
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION {function}() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                UPDATE {session_table}
+                SET last_message_at = GREATEST(
+                        COALESCE(last_message_at, NEW.created_at),
+                        NEW.created_at
+                    ),
+                    message_count = message_count + 1
+                WHERE id = NEW.session_id;
+                RETURN NEW;
+            END;
+            $$
+        """)
+        op.execute(f"""
+            CREATE TRIGGER tr_{message_table}_bump_session
+            AFTER INSERT ON {message_table}
+            FOR EACH ROW EXECUTE FUNCTION {function}()
+        """)
+
+
+def downgrade() -> None:
+    for message_table, _, function in SESSION_TRACKING:
+        op.execute(f"DROP TRIGGER IF EXISTS tr_{message_table}_bump_session ON {message_table}")
+        op.execute(f"DROP FUNCTION IF EXISTS {function}()")
@@ -0,0 +1,49 @@
+"""Add (session_id, role, blocked, created_at) message lookup indexes
+
+Revision ID: 014
+Revises: 013
+Create Date: 2025-11-25
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # "First user message in session" lookups (session list previews)
+        # match on session/role/blocked and read created_at in order
+        op.create_index(
+            'ix_messages_session_role_blocked_created',
+            'messages',
+            ['session_id', 'role', 'blocked', 'created_at'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_parent_messages_session_role_created',
+            'parent_messages',
+            ['session_id', 'role', 'created_at'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_parent_messages_session_role_created',
+            table_name='parent_messages',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_messages_session_role_blocked_created',
+            table_name='messages',
+            postgresql_concurrently=True
+        )
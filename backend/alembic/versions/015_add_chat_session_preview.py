@@ -0,0 +1,46 @@
+"""Add denormalized preview columns to chat_sessions
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-11-25
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('chat_sessions', sa.Column('preview', sa.String(100), nullable=True))
+    op.add_column(
+        'chat_sessions',
+        sa.Column('first_user_message_id', postgresql.UUID(as_uuid=True), nullable=True)
+    )
+
+    # Backfill from each session's first allowed user message
+    op.execute(sa.text("""
+        UPDATE chat_sessions cs
+        SET first_user_message_id = first_msg.id,
+            preview = LEFT(first_msg.content, 100)
+        FROM (
+            SELECT DISTINCT ON (session_id) session_id, id, content
+            FROM messages
+            WHERE role = 'user' AND blocked = false
+            ORDER BY session_id, created_at
+        ) first_msg
+        WHERE first_msg.session_id = cs.id
+    """))
+
+
+def downgrade() -> None:
+    op.drop_column('chat_sessions', 'first_user_message_id')
+    op.drop_column('chat_sessions', 'preview')
@@ -0,0 +1,44 @@
+"""Default session last_message_at to the database clock
+
+Revision ID: 016
+Revises: 015
+Create Date: 2025-11-25
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SESSION_TABLES = ('chat_sessions', 'parent_chat_sessions')
+
+
+def upgrade() -> None:
+    # New sessions get their initial timestamp from the database. The column
+    # is timestamp without time zone holding naive UTC (as the Python-side
+    # utcnow() defaults do), so now() is converted to UTC rather than left
+    # in the server's TimeZone
+    for table in SESSION_TABLES:
+        op.alter_column(
+            table,
+            'last_message_at',
+            existing_type=sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())")
+        )
+
+
+def downgrade() -> None:
+    for table in SESSION_TABLES:
+        op.alter_column(
+            table,
+            'last_message_at',
+            existing_type=sa.DateTime(),
+            server_default=None
+        )
@@ -0,0 +1,40 @@
+"""Add partial index on open chat sessions
+
+Revision ID: 017
+Revises: 016
+Create Date: 2025-11-26
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The current-session lookup filters on child_id with ended_at IS NULL;
+    # only open sessions are indexed, so it stays tiny next to the table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chat_sessions_child_open',
+            'chat_sessions',
+            ['child_id'],
+            postgresql_where=sa.text('ended_at IS NULL'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_chat_sessions_child_open',
+            table_name='chat_sessions',
+            postgresql_concurrently=True
+        )
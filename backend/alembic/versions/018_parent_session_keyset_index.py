@@ -0,0 +1,72 @@
+"""Index parent chat sessions for keyset pagination
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sessions created before 016 without any messages never got a
+    # timestamp; NULLs would drop out of (last_message_at, id) comparisons
+    op.execute(sa.text(
+        "UPDATE parent_chat_sessions SET last_message_at = started_at WHERE last_message_at IS NULL"
+    ))
+    op.alter_column(
+        'parent_chat_sessions',
+        'last_message_at',
+        existing_type=sa.DateTime(),
+        existing_server_default=sa.text("timezone('utc', now())"),
+        nullable=False
+    )
+
+    # Cursor pages order by (last_message_at, id); carrying id in the index
+    # keeps the seek and the tiebreak inside one range scan. The old index
+    # is a prefix of the new one, so it goes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_parent_chat_sessions_parent_last_message_id',
+            'parent_chat_sessions',
+            ['parent_id', 'last_message_at', 'id'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_parent_chat_sessions_parent_last_message',
+            table_name='parent_chat_sessions',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_parent_chat_sessions_parent_last_message',
+            'parent_chat_sessions',
+            ['parent_id', 'last_message_at'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_parent_chat_sessions_parent_last_message_id',
+            table_name='parent_chat_sessions',
+            postgresql_concurrently=True
+        )
+
+    op.alter_column(
+        'parent_chat_sessions',
+        'last_message_at',
+        existing_type=sa.DateTime(),
+        existing_server_default=sa.text("timezone('utc', now())"),
+        nullable=True
+    )
@@ -0,0 +1,51 @@
+"""Cover the top-topics dashboard query with its index
+
+Revision ID: 019
+Revises: 018
+Create Date: 2025-11-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The dashboard's top topics read only these columns, so carrying them
+    # in the index lets Postgres answer with an index-only scan
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_child_topic_summary_child_total_time_covering',
+            'child_topic_summary',
+            ['child_id', sa.text('total_time_seconds DESC')],
+            postgresql_include=['topic', 'message_count', 'last_accessed'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_child_topic_summary_child_total_time',
+            table_name='child_topic_summary',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_child_topic_summary_child_total_time',
+            'child_topic_summary',
+            ['child_id', sa.text('total_time_seconds DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_child_topic_summary_child_total_time_covering',
+            table_name='child_topic_summary',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,36 @@
+"""Drop the (session_id, role, blocked, created_at) message index
+
+Revision ID: 020
+Revises: 019
+Create Date: 2025-11-29
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '020'
+down_revision: Union[str, None] = '019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Session previews are read from chat_sessions.preview (015), so no
+    # query seeks on this index any more; it only slowed message inserts
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_messages_session_role_blocked_created"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_messages_session_role_blocked_created',
+            'messages',
+            ['session_id', 'role', 'blocked', 'created_at'],
+            postgresql_concurrently=True
+        )
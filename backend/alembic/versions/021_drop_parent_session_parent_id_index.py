@@ -0,0 +1,36 @@
+"""Drop the single-column parent_chat_sessions.parent_id index
+
+Revision ID: 021
+Revises: 020
+Create Date: 2025-11-29
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '021'
+down_revision: Union[str, None] = '020'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The (parent_id, last_message_at, id) index serves parent_id-only
+    # lookups via its leftmost prefix
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_parent_chat_sessions_parent_id"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_parent_chat_sessions_parent_id',
+            'parent_chat_sessions',
+            ['parent_id'],
+            postgresql_concurrently=True
+        )
@@ -4,12 +4,20 @@ API dependencies for authentication and database session management.
 These dependencies are injected into route handlers via FastAPI's
 dependency injection system.
 """
-from typing import Generator, Tuple
+import hashlib
+import json
+import time
+from datetime import datetime
+from typing import AsyncGenerator, Optional, Tuple
 from uuid import UUID
-from fastapi import Depends, Header
+from cachetools import TTLCache
+from fastapi import Depends, Header, Request
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from sqlalchemy import bindparam, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from app.database import AsyncSessionLocal
+from app.core.cache import cache_get, cache_set, cache_delete
 from app.core.security import decode_token, verify_token_type
 from app.core.exceptions import AuthenticationError, AuthorizationError
 from app.models import Parent, Child
@@ -18,26 +26,66 @@ from app.models import Parent, Child
 # OAuth2 scheme for token extraction from Authorization header
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/parent/login")
 
-
-def get_db() -> Generator[Session, None, None]:
+# Verified access-token payloads keyed by a digest of the raw token, so a
+# token presented repeatedly skips signature verification and JSON parsing.
+# TTLCache is not thread-safe; it is only touched from the event loop via
+# the async get_current_user_token below.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10000, ttl=60)
+
+# Cross-request (Redis) cache lifetime for resolved kid rows
+KID_CACHE_TTL_SECONDS = 300
+
+# Auth hot-path statements, built once at import so each request only binds
+# parameters instead of rebuilding the expression tree
+_PARENT_BY_ID = select(Parent).where(Parent.id == bindparam("id"))
+_CHILD_BY_ID = select(Child).where(Child.id == bindparam("id"))
+_CHILD_OWNED = select(Child).where(
+    Child.id == bindparam("cid"),
+    Child.parent_id == bindparam("pid")
+)
+_PARENT_WITH_OWNED_CHILD = (
+    select(Parent, Child)
+    .outerjoin(
+        Child,
+        (Child.id == bindparam("cid")) & (Child.parent_id == Parent.id)
+    )
+    .where(Parent.id == bindparam("pid"))
+)
+_anchor = select(literal(1).label("anchor")).subquery()
+_USER_BY_ID = (
+    select(Parent, Child)
+    .select_from(_anchor)
+    .outerjoin(Parent, Parent.id == bindparam("id"))
+    .outerjoin(Child, Child.id == bindparam("id"))
+)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Database session dependency.
 
-    Yields a database session and ensures it's properly closed.
+    Yields an async database session and ensures it's properly closed.
     """
-    db = SessionLocal()
+    db = AsyncSessionLocal()
     try:
         yield db
+    except Exception:
+        # Don't hand a connection with a failed transaction back to the pool
+        await db.rollback()
+        raise
     finally:
-        db.close()
+        await db.close()
 
 
-def get_current_user_token(
+async def get_current_user_token(
     token: str = Depends(oauth2_scheme)
 ) -> dict:
     """
     Validate JWT token and return payload.
 
+    Declared async so FastAPI runs it on the event loop rather than the
+    threadpool; decoding is CPU-only and the token cache needs no lock.
+
     Args:
         token: JWT token from Authorization header
 
@@ -47,6 +95,15 @@ def get_current_user_token(
     Raises:
         AuthenticationError: If token is invalid
     """
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _TOKEN_CACHE.get(cache_key)
+    if payload is not None:
+        # The cache TTL may outlive the token itself
+        if payload.get("exp", 0) > time.time():
+            return payload
+        _TOKEN_CACHE.pop(cache_key, None)
+        raise AuthenticationError("Invalid or expired token")
+
     payload = decode_token(token)
 
     if not payload:
@@ -55,17 +112,82 @@ def get_current_user_token(
     if not verify_token_type(payload, "access"):
         raise AuthenticationError("Invalid token type")
 
+    _TOKEN_CACHE[cache_key] = payload
     return payload
 
 
-def get_current_parent(
+def get_request_cache(request: Request) -> dict:
+    """
+    Per-request memo for lookups repeated within a single request.
+
+    Args:
+        request: Current request
+
+    Returns:
+        Dict stored on ``request.state``, shared by all dependencies and
+        handlers serving this request
+    """
+    if not hasattr(request.state, "cache"):
+        request.state.cache = {}
+    return request.state.cache
+
+
+def _get_cached_user(request: Request, role: str) -> Optional[Parent | Child]:
+    """
+    Return the user already resolved for this request, if any.
+
+    Auth dependencies stash the loaded user on ``request.state`` so that
+    distinct dependencies resolving the same user share one SELECT.
+
+    Args:
+        request: Current request
+        role: Expected user role
+
+    Returns:
+        Cached user object, or None if not resolved yet for this role
+    """
+    cached = getattr(request.state, "current_user", None)
+    if cached and cached[0] == role:
+        return cached[1]
+    return None
+
+
+async def load_user_by_id(
+    db: AsyncSession,
+    user_id: UUID
+) -> Optional[Tuple[str, Parent | Child]]:
+    """
+    Load a user by ID from either the parents or children table.
+
+    Both tables are probed in a single round-trip by left-joining each onto
+    a one-row anchor, instead of issuing one SELECT per table.
+
+    Args:
+        db: Database session
+        user_id: UUID of the user
+
+    Returns:
+        Tuple of (role, user_object), or None if no user has this ID
+    """
+    parent, child = (await db.execute(_USER_BY_ID, {"id": user_id})).one()
+
+    if parent:
+        return ("parent", parent)
+    if child:
+        return ("kid", child)
+    return None
+
+
+async def get_current_parent(
+    request: Request,
     payload: dict = Depends(get_current_user_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Parent:
     """
     Get current authenticated parent.
 
     Args:
+        request: Current request (used for per-request user caching)
         payload: Decoded JWT token payload
         db: Database session
 
@@ -79,23 +201,72 @@ def get_current_parent(
     if payload.get("role") != "parent":
         raise AuthorizationError("Parent access required")
 
+    parent = _get_cached_user(request, "parent")
+    if parent:
+        return parent
+
     parent_id = UUID(payload["sub"])
-    parent = db.query(Parent).filter(Parent.id == parent_id).first()
+    parent = (await db.execute(_PARENT_BY_ID, {"id": parent_id})).scalar_one_or_none()
 
     if not parent:
         raise AuthenticationError("Parent not found")
 
+    request.state.current_user = ("parent", parent)
     return parent
 
 
-def get_current_kid(
+def _kid_cache_key(kid_id: UUID) -> str:
+    return f"kid:{kid_id}"
+
+
+def _serialize_kid(kid: Child) -> bytes:
+    # password_hash is deliberately left out of the cache; kid routes never
+    # read it
+    return json.dumps({
+        "id": str(kid.id),
+        "parent_id": str(kid.parent_id),
+        "email": kid.email,
+        "name": kid.name,
+        "created_at": kid.created_at.isoformat(),
+        "updated_at": kid.updated_at.isoformat(),
+    }).encode()
+
+
+def _deserialize_kid(raw: bytes) -> Child:
+    data = json.loads(raw)
+    kid = Child(
+        id=UUID(data["id"]),
+        parent_id=UUID(data["parent_id"]),
+        email=data["email"],
+        name=data["name"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"])
+    )
+    # Treat the rebuilt object as a clean, already-persisted row
+    make_transient_to_detached(kid)
+    return kid
+
+
+async def invalidate_cached_kid(kid_id: UUID) -> None:
+    """
+    Drop a kid's cached row after it changes or is deleted.
+
+    Args:
+        kid_id: UUID of the kid
+    """
+    await cache_delete(_kid_cache_key(kid_id))
+
+
+async def get_current_kid(
+    request: Request,
     payload: dict = Depends(get_current_user_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Child:
     """
     Get current authenticated kid.
 
     Args:
+        request: Current request (used for per-request user caching)
         payload: Decoded JWT token payload
         db: Database session
 
@@ -109,23 +280,38 @@ def get_current_kid(
     if payload.get("role") != "kid":
         raise AuthorizationError("Kid access required")
 
+    kid = _get_cached_user(request, "kid")
+    if kid:
+        return kid
+
     kid_id = UUID(payload["sub"])
-    kid = db.query(Child).filter(Child.id == kid_id).first()
 
-    if not kid:
-        raise AuthenticationError("Kid not found")
+    raw = await cache_get(_kid_cache_key(kid_id))
+    if raw is not None:
+        # Attach to this request's session without a SELECT
+        kid = await db.merge(_deserialize_kid(raw), load=False)
+    else:
+        kid = (await db.execute(_CHILD_BY_ID, {"id": kid_id})).scalar_one_or_none()
+
+        if not kid:
+            raise AuthenticationError("Kid not found")
+
+        await cache_set(_kid_cache_key(kid_id), _serialize_kid(kid), KID_CACHE_TTL_SECONDS)
 
+    request.state.current_user = ("kid", kid)
     return kid
 
 
-def get_current_user_with_role(
+async def get_current_user_with_role(
+    request: Request,
     payload: dict = Depends(get_current_user_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Tuple[str, Parent | Child]:
     """
     Get current user regardless of role.
 
     Args:
+        request: Current request (used for per-request user caching)
         payload: Decoded JWT token payload
         db: Database session
 
@@ -138,24 +324,75 @@ def get_current_user_with_role(
     role = payload.get("role")
     user_id = UUID(payload["sub"])
 
-    if role == "parent":
-        user = db.query(Parent).filter(Parent.id == user_id).first()
-        if not user:
-            raise AuthenticationError("Parent not found")
-        return (role, user)
-    elif role == "kid":
-        user = db.query(Child).filter(Child.id == user_id).first()
-        if not user:
-            raise AuthenticationError("Kid not found")
-        return (role, user)
-    else:
+    if role not in ("parent", "kid"):
         raise AuthenticationError("Invalid user role")
 
+    cached = _get_cached_user(request, role)
+    if cached:
+        return (role, cached)
+
+    loaded = await load_user_by_id(db, user_id)
+    if not loaded or loaded[0] != role:
+        raise AuthenticationError("Parent not found" if role == "parent" else "Kid not found")
+
+    user = loaded[1]
+    request.state.current_user = (role, user)
+    return (role, user)
+
+
+async def get_current_parent_child(
+    request: Request,
+    child_id: UUID,
+    payload: dict = Depends(get_current_user_token),
+    db: AsyncSession = Depends(get_db)
+) -> Child:
+    """
+    Get a child owned by the current authenticated parent.
+
+    Loads the parent and the owned child in a single query, replacing a
+    get_current_parent + verify_parent_owns_child pair on routes that take
+    a ``child_id`` path parameter.
+
+    Args:
+        request: Current request (used for per-request user caching)
+        child_id: UUID of the child from the route path
+        payload: Decoded JWT token payload
+        db: Database session
+
+    Returns:
+        Child model instance if owned by the parent
+
+    Raises:
+        AuthenticationError: If the parent is not found
+        AuthorizationError: If user is not a parent or does not own the child
+    """
+    if payload.get("role") != "parent":
+        raise AuthorizationError("Parent access required")
+
+    parent = _get_cached_user(request, "parent")
+    if parent:
+        return await verify_parent_owns_child(parent, child_id, db)
+
+    row = (await db.execute(
+        _PARENT_WITH_OWNED_CHILD, {"pid": UUID(payload["sub"]), "cid": child_id}
+    )).first()
+
+    if not row:
+        raise AuthenticationError("Parent not found")
+
+    parent, child = row
+    request.state.current_user = ("parent", parent)
+
+    if not child:
+        raise AuthorizationError("You do not have access to this child's data")
+
+    return child
+
 
-def verify_parent_owns_child(
+async def verify_parent_owns_child(
     parent: Parent,
     child_id: UUID,
-    db: Session
+    db: AsyncSession
 ) -> Child:
     """
     Verify that a parent owns a specific child.
@@ -171,10 +408,9 @@ def verify_parent_owns_child(
     Raises:
         AuthorizationError: If parent does not own the child
     """
-    child = db.query(Child).filter(
-        Child.id == child_id,
-        Child.parent_id == parent.id
-    ).first()
+    child = (await db.execute(
+        _CHILD_OWNED, {"cid": child_id, "pid": parent.id}
+    )).scalar_one_or_none()
 
     if not child:
         raise AuthorizationError("You do not have access to this child's data")
@@ -4,7 +4,7 @@ Authentication API endpoints.
 Handles parent registration, parent/kid login, and token refresh.
 """
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_db
 from app.schemas.auth import (
     ParentRegister,
@@ -27,16 +27,16 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
     summary="Register a new parent account",
     description="Create a new parent account with email, password, and name."
 )
-def register_parent(
+async def register_parent(
     data: ParentRegister,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> ParentResponse:
     """
     Register a new parent account.
 
     Creates a parent account and sets up default content rules.
     """
-    parent = AuthService.register_parent(db, data)
+    parent = await AuthService.register_parent(db, data)
     return parent
 
 
@@ -46,16 +46,16 @@ def register_parent(
     summary="Parent login",
     description="Authenticate a parent and return JWT tokens."
 )
-def login_parent(
+async def login_parent(
     data: ParentLogin,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> LoginResponse:
     """
     Authenticate a parent and return access tokens.
 
     Returns access and refresh tokens for authenticated parent.
     """
-    parent = AuthService.authenticate_parent(db, data.email, data.password)
+    parent = await AuthService.authenticate_parent(db, data.email, data.password)
     tokens = AuthService.create_tokens_for_parent(parent)
     return LoginResponse(
         user={
@@ -77,16 +77,16 @@ def login_parent(
     summary="Kid login",
     description="Authenticate a kid and return JWT tokens."
 )
-def login_kid(
+async def login_kid(
     data: KidLogin,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> LoginResponse:
     """
     Authenticate a kid and return access tokens.
 
     Returns access and refresh tokens for authenticated kid.
     """
-    child = AuthService.authenticate_kid(db, data.email, data.password)
+    child = await AuthService.authenticate_kid(db, data.email, data.password)
     tokens = AuthService.create_tokens_for_kid(child)
     return LoginResponse(
         user={
@@ -108,7 +108,7 @@ def login_kid(
     summary="Refresh JWT tokens",
     description="Get new access and refresh tokens using a valid refresh token."
 )
-def refresh_token(data: TokenRefresh) -> Token:
+async def refresh_token(data: TokenRefresh) -> Token:
     """
     Refresh JWT tokens.
 
@@ -5,19 +5,25 @@ Handles chat functionality with content filtering and AI integration.
 """
 from datetime import datetime
 from uuid import UUID
-from typing import Iterator
+from typing import AsyncIterator, Optional, Tuple
 import json
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from app.api.deps import get_db, get_current_kid
-from app.models import Child, ContentRule, ChatSession, Message, MessageRole
+from pydantic import TypeAdapter
+from sqlalchemy import select, func, desc, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+from app.api.deps import get_db, get_current_kid, get_request_cache
+from app.database import AsyncSessionLocal
+from app.models import Child, ChatSession, Message, MessageRole
 from app.schemas.message import (
     ChatMessageRequest,
     ChatResponse,
     MessageResponse,
     ChatHistoryResponse,
+    ChatHistoryPage,
     ChatSessionResponse,
     ChatSessionSummary,
     PaginatedChatSessions,
@@ -26,13 +32,34 @@ from app.schemas.message import (
     YouTubeVideoSuggestion,
 )
 from app.services.content_filter import filter_message
+from app.services.content_rule_service import get_content_rules
 from app.services.ai_service import get_ai_response, get_ai_response_stream, AIService, generate_session_title
 from app.services.insights_service import process_message_for_insights
-from app.services.youtube_service import get_video_suggestion, get_video_suggestion_sync
+from app.services.youtube_service import get_video_suggestion
+from app.config import get_settings
 from app.core.exceptions import NotFoundError, AuthorizationError
+from app.core.pagination import encode_cursor, decode_cursor
+
+settings = get_settings()
 
 router = APIRouter(prefix="/kid", tags=["kid"])
 
+# Columns backing MessageResponse; read-only endpoints select these directly
+# so history pages don't pay for full ORM identity-map bookkeeping.
+_MESSAGE_RESPONSE_COLUMNS = (
+    Message.id,
+    Message.role,
+    Message.content,
+    Message.blocked,
+    Message.created_at,
+)
+
+# Validates whole message lists in one pydantic-core call
+_MESSAGE_LIST = TypeAdapter(list[MessageResponse])
+
+# Sessions fetched per round trip by the streamed chat-history endpoint
+HISTORY_BATCH_SIZE = 100
+
 
 @router.post(
     "/chat",
@@ -42,8 +69,10 @@ router = APIRouter(prefix="/kid", tags=["kid"])
 )
 async def send_chat_message(
     data: ChatMessageRequest,
+    background_tasks: BackgroundTasks,
     kid: Child = Depends(get_current_kid),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    request_cache: dict = Depends(get_request_cache)
 ) -> ChatResponse:
     """
     Send a chat message to the AI.
@@ -63,10 +92,12 @@ async def send_chat_message(
     # Get or create chat session
     if data.session_id:
         # Verify session belongs to this kid
-        current_session = db.query(ChatSession).filter(
-            ChatSession.id == data.session_id,
-            ChatSession.child_id == kid.id
-        ).first()
+        current_session = (await db.execute(
+            select(ChatSession).where(
+                ChatSession.id == data.session_id,
+                ChatSession.child_id == kid.id
+            )
+        )).scalars().first()
         if not current_session:
             raise NotFoundError("Chat session not found or doesn't belong to you")
     else:
@@ -74,24 +105,22 @@ async def send_chat_message(
         current_session = ChatSession(
             child_id=kid.id,
             title="New Chat",
-            last_message_at=datetime.utcnow(),
             message_count=0
         )
         db.add(current_session)
-        db.commit()
-        db.refresh(current_session)
+        # Flush for the generated id; committed with the user message below
+        await db.flush()
 
     # Get parent's content rules
-    content_rules = db.query(ContentRule).filter(
-        ContentRule.parent_id == kid.parent_id
-    ).first()
+    content_rules = await get_content_rules(kid.parent_id, request_cache)
 
     if not content_rules:
         # This shouldn't happen as rules are created on parent registration
         raise NotFoundError("Content rules not configured")
 
-    # Filter the message against parent's rules
-    is_allowed, block_reason = filter_message(data.message, content_rules)
+    # Filter the message against parent's rules (CPU-bound pattern scan,
+    # kept off the event loop)
+    is_allowed, block_reason = await run_in_threadpool(filter_message, data.message, content_rules)
 
     if not is_allowed:
         # Message blocked - save it and return error
@@ -104,12 +133,7 @@ async def send_chat_message(
         )
         db.add(blocked_message)
 
-        # Update session metadata
-        current_session.last_message_at = datetime.utcnow()
-        current_session.message_count += 1
-
-        db.commit()
-        db.refresh(blocked_message)
+        await db.commit()
 
         return ChatResponse(
             user_message=MessageResponse.model_validate(blocked_message),
@@ -128,22 +152,31 @@ async def send_chat_message(
         blocked=False
     )
     db.add(user_message)
-    db.commit()
-    db.refresh(user_message)
-
-    # Get conversation history for context
-    session_messages = db.query(Message).filter(
-        Message.session_id == current_session.id,
-        Message.blocked == False
-    ).order_by(Message.created_at.asc()).all()
-
-    # Format history for AI (exclude the current message we just added)
-    conversation_history = AIService.format_history_from_messages(
-        session_messages[:-1]  # Exclude current message as it will be added by AI service
-    )
+    await db.flush()
+    await _record_session_preview(db, current_session, user_message)
+
+    # Get recent conversation history for context (bounded to the AI's
+    # context window, excluding the message we just added); only the
+    # columns the prompt needs are read
+    recent_messages = (await db.execute(
+        select(Message.role, Message.content, Message.blocked).where(
+            Message.session_id == current_session.id,
+            Message.id != user_message.id,
+            Message.blocked == False
+        ).order_by(Message.created_at.desc()).limit(settings.AI_CONTEXT_MESSAGES)
+    )).all()
+    recent_messages.reverse()
 
-    # Get AI response
-    ai_response_text = get_ai_response(data.message, conversation_history)
+    # Format history for AI
+    conversation_history = AIService.format_history_from_messages(recent_messages)
+
+    # Commit the session and user message before calling the model, so
+    # neither the session row lock nor a pooled connection is held for the
+    # length of the AI call
+    await db.commit()
+
+    # Get AI response (awaited on the shared async client)
+    ai_response_text = await get_ai_response(data.message, conversation_history)
 
     # Save AI response
     assistant_message = Message(
@@ -154,30 +187,25 @@ async def send_chat_message(
     )
     db.add(assistant_message)
 
-    # Update session metadata
-    current_session.last_message_at = datetime.utcnow()
-    current_session.message_count += 2  # Both user and assistant messages
-
-    # Generate title after 2-3 user messages if still default
     session_title = current_session.title
-    user_messages_in_session = [
-        msg.content for msg in session_messages if msg.role == MessageRole.USER
-    ]
-
-    # Generate title after first user message if still default
-    if (len(user_messages_in_session) == 1):
-        # Generate AI title
-        # new_title = generate_session_title(user_messages_in_session)
-        new_title = user_messages_in_session[0]
+    # Generate title after first user message if still default (the
+    # title stays "New Chat" until then, so no message scan is needed)
+    if current_session.title in (None, "New Chat"):
+        # Use the message as a provisional title; the AI title is generated
+        # after the response is sent
+        new_title = data.message[:255]
         current_session.title = new_title
         session_title = new_title
+        background_tasks.add_task(
+            _generate_and_store_title, current_session.id, new_title, data.message
+        )
 
-    db.commit()
-    db.refresh(assistant_message)
+    # Second short transaction for the reply and the title
+    await db.commit()
 
     # Process message for insights (async-friendly, non-blocking)
     try:
-        process_message_for_insights(db, user_message, assistant_message)
+        await process_message_for_insights(db, user_message, assistant_message)
     except Exception:
         # Don't fail the chat response if insights processing fails
         pass
@@ -210,8 +238,10 @@ async def send_chat_message(
 )
 async def send_chat_message_stream(
     data: ChatMessageRequest,
+    background_tasks: BackgroundTasks,
     kid: Child = Depends(get_current_kid),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    request_cache: dict = Depends(get_request_cache)
 ) -> StreamingResponse:
     """
     Send a chat message to the AI with streaming response.
@@ -227,16 +257,18 @@ async def send_chat_message_stream(
     Returns:
         StreamingResponse with Server-Sent Events
     """
-    def generate_stream() -> Iterator[str]:
+    async def generate_stream() -> AsyncIterator[str]:
         """Generate SSE stream."""
         try:
             # Get or create chat session
             if data.session_id:
                 # Verify session belongs to this kid
-                current_session = db.query(ChatSession).filter(
-                    ChatSession.id == data.session_id,
-                    ChatSession.child_id == kid.id
-                ).first()
+                current_session = (await db.execute(
+                    select(ChatSession).where(
+                        ChatSession.id == data.session_id,
+                        ChatSession.child_id == kid.id
+                    )
+                )).scalars().first()
                 if not current_session:
                     yield f"event: error\ndata: {json.dumps({'error': 'Chat session not found or does not belong to you'})}\n\n"
                     return
@@ -245,25 +277,22 @@ async def send_chat_message_stream(
                 current_session = ChatSession(
                     child_id=kid.id,
                     title="New Chat",
-                    last_message_at=datetime.utcnow(),
                     message_count=0
                 )
                 db.add(current_session)
-                db.commit()
-                db.refresh(current_session)
+                # Flush for the generated id; it commits with the first message
+                await db.flush()
 
             # Get parent's content rules
-            content_rules = db.query(ContentRule).filter(
-                ContentRule.parent_id == kid.parent_id
-            ).first()
+            content_rules = await get_content_rules(kid.parent_id, request_cache)
 
             if not content_rules:
                 # Send error event
                 yield f"event: error\ndata: {json.dumps({'error': 'Content rules not configured'})}\n\n"
                 return
 
-            # Filter the message against parent's rules
-            is_allowed, block_reason = filter_message(data.message, content_rules)
+            # Filter the message against parent's rules (off the event loop)
+            is_allowed, block_reason = await run_in_threadpool(filter_message, data.message, content_rules)
 
             if not is_allowed:
                 # Message blocked - save it and send blocked event
@@ -276,12 +305,7 @@ async def send_chat_message_stream(
                 )
                 db.add(blocked_message)
 
-                # Update session metadata
-                current_session.last_message_at = datetime.utcnow()
-                current_session.message_count += 1
-
-                db.commit()
-                db.refresh(blocked_message)
+                await db.commit()
 
                 # Send blocked event
                 yield f"event: blocked\ndata: {json.dumps({'block_reason': block_reason, 'message_id': str(blocked_message.id), 'session_id': str(current_session.id), 'session_title': current_session.title})}\n\n"
@@ -295,26 +319,34 @@ async def send_chat_message_stream(
                 blocked=False
             )
             db.add(user_message)
-            db.commit()
-            db.refresh(user_message)
+            await db.flush()
+            await _record_session_preview(db, current_session, user_message)
+
+            # Get recent conversation history for context (bounded to the AI's
+            # context window, excluding the message we just added); only the
+            # columns the prompt needs are read
+            recent_messages = (await db.execute(
+                select(Message.role, Message.content, Message.blocked).where(
+                    Message.session_id == current_session.id,
+                    Message.id != user_message.id,
+                    Message.blocked == False
+                ).order_by(Message.created_at.desc()).limit(settings.AI_CONTEXT_MESSAGES)
+            )).all()
+            recent_messages.reverse()
+
+            # One commit for the session and user message; it also hands the
+            # connection back to the pool for the length of the AI stream
+            await db.commit()
 
             # Send user message event
             yield f"event: user_message\ndata: {json.dumps({'id': str(user_message.id), 'content': data.message, 'session_id': str(current_session.id)})}\n\n"
 
-            # Get conversation history for context
-            session_messages = db.query(Message).filter(
-                Message.session_id == current_session.id,
-                Message.blocked == False
-            ).order_by(Message.created_at.asc()).all()
-
-            # Format history for AI (exclude the current message we just added)
-            conversation_history = AIService.format_history_from_messages(
-                session_messages[:-1]
-            )
+            # Format history for AI
+            conversation_history = AIService.format_history_from_messages(recent_messages)
 
             # Stream AI response
             full_response = ""
-            for chunk in get_ai_response_stream(data.message, conversation_history):
+            async for chunk in get_ai_response_stream(data.message, conversation_history):
                 full_response += chunk
                 # Send chunk event
                 yield f"event: chunk\ndata: {json.dumps({'content': chunk})}\n\n"
@@ -328,34 +360,32 @@ async def send_chat_message_stream(
             )
             db.add(assistant_message)
 
-            # Update session metadata
-            current_session.last_message_at = datetime.utcnow()
-            current_session.message_count += 2  # Both user and assistant messages
-
             # Generate title after first user message if still default
             session_title = current_session.title
-            user_messages_in_session = [
-                msg.content for msg in session_messages if msg.role == MessageRole.USER
-            ]
-
-            if len(user_messages_in_session) == 1:
-                new_title = generate_session_title(user_messages_in_session)
+            # Title stays at the default until the first allowed user message,
+            # so no scan of the session's messages is needed
+            if current_session.title in (None, "New Chat"):
+                # Provisional title now; the AI title is generated once the
+                # stream has finished
+                new_title = data.message[:255]
                 current_session.title = new_title
                 session_title = new_title
+                background_tasks.add_task(
+                    _generate_and_store_title, current_session.id, new_title, data.message
+                )
 
-            db.commit()
-            db.refresh(assistant_message)
+            await db.commit()
 
             # Process message for insights (non-blocking)
             try:
-                process_message_for_insights(db, user_message, assistant_message)
+                await process_message_for_insights(db, user_message, assistant_message)
             except Exception:
                 pass
 
-            # Get YouTube video suggestion (synchronous)
+            # Get YouTube video suggestion
             video_suggestion = None
             try:
-                video_suggestion = get_video_suggestion_sync(data.message, full_response)
+                video_suggestion = await get_video_suggestion(data.message, full_response)
             except Exception:
                 pass
 
@@ -386,55 +416,142 @@ async def send_chat_message_stream(
     )
 
 
+async def _load_history_batch(
+    db: AsyncSession,
+    child_id: UUID,
+    cursor: Optional[Tuple[datetime, UUID]],
+    limit: int
+) -> list[ChatSessionResponse]:
+    """
+    Load one keyset-paginated batch of sessions with their visible messages.
+
+    Args:
+        db: Database session
+        child_id: UUID of the kid whose history is read
+        cursor: (started_at, id) of the last session already returned,
+            or None to start from the newest session
+        limit: Maximum number of sessions to return
+
+    Returns:
+        Sessions newest first, each with its unblocked messages in order
+    """
+    page_query = select(
+        ChatSession.id,
+        ChatSession.child_id,
+        ChatSession.started_at,
+        ChatSession.ended_at
+    ).where(ChatSession.child_id == child_id)
+    if cursor is not None:
+        page_query = page_query.where(tuple_(ChatSession.started_at, ChatSession.id) < cursor)
+    sessions = (await db.execute(
+        page_query.order_by(ChatSession.started_at.desc(), ChatSession.id.desc()).limit(limit)
+    )).all()
+    if not sessions:
+        return []
+
+    # Visible messages for the whole batch in one query
+    message_rows = (await db.execute(
+        select(Message.session_id, *_MESSAGE_RESPONSE_COLUMNS).where(
+            Message.session_id.in_([session.id for session in sessions]),
+            Message.blocked == False
+        ).order_by(Message.created_at)
+    )).all()
+
+    messages_by_session: dict[UUID, list] = {}
+    for row in message_rows:
+        messages_by_session.setdefault(row.session_id, []).append(row)
+
+    return [
+        ChatSessionResponse(
+            id=session.id,
+            child_id=session.child_id,
+            started_at=session.started_at,
+            ended_at=session.ended_at,
+            messages=_MESSAGE_LIST.validate_python(
+                messages_by_session.get(session.id, []),
+                from_attributes=True
+            )
+        )
+        for session in sessions
+    ]
+
+
+@router.get(
+    "/chat-history/page",
+    response_model=ChatHistoryPage,
+    summary="Get a page of chat history",
+    description="Get the kid's chat history one keyset-paginated page at a time."
+)
+async def get_chat_history_page(
+    limit: int = Query(default=20, ge=1, le=50, description="Number of sessions per page"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    kid: Child = Depends(get_current_kid),
+    db: AsyncSession = Depends(get_db)
+) -> ChatHistoryPage:
+    """
+    Get one page of the kid's chat history.
+
+    Sessions come newest first with their messages (blocked messages
+    excluded). Each page is a bounded index range scan, however long the
+    history is.
+    """
+    sessions = await _load_history_batch(
+        db,
+        kid.id,
+        decode_cursor(cursor) if cursor else None,
+        limit
+    )
+    next_cursor = encode_cursor(sessions[-1].started_at, sessions[-1].id) if len(sessions) == limit else None
+
+    return ChatHistoryPage(sessions=sessions, next_cursor=next_cursor)
+
+
 @router.get(
     "/chat-history",
     response_model=ChatHistoryResponse,
     summary="Get own chat history",
-    description="Get the kid's own chat history."
+    description="Get the kid's own chat history. Deprecated: use the paginated /chat-sessions endpoint.",
+    deprecated=True
 )
-def get_own_chat_history(
+async def get_own_chat_history(
     kid: Child = Depends(get_current_kid),
-    db: Session = Depends(get_db)
-) -> ChatHistoryResponse:
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
     """
     Get the kid's own chat history.
 
     Returns all chat sessions and messages (excluding blocked messages
-    from the kid's view for better experience).
+    from the kid's view for better experience). Sessions are read in
+    keyset-paginated batches and streamed out one at a time, so a long
+    history is never held in memory at once; new callers should page
+    through /chat-sessions instead.
     """
-    # Get all sessions
-    sessions = db.query(ChatSession).filter(
-        ChatSession.child_id == kid.id
-    ).order_by(ChatSession.started_at.desc()).all()
+    async def stream_history() -> AsyncIterator[bytes]:
+        total_sessions = 0
+        total_messages = 0
+        cursor = None
 
-    # Build response (exclude blocked messages from kid's view)
-    session_responses = []
-    total_messages = 0
+        yield b'{"sessions":['
+        while True:
+            sessions = await _load_history_batch(db, kid.id, cursor, HISTORY_BATCH_SIZE)
+            # End the read transaction so the connection goes back to the
+            # pool while the client drains this batch
+            await db.commit()
 
-    for session in sessions:
-        # Filter out blocked messages for kid's view
-        messages = [
-            MessageResponse.model_validate(msg)
-            for msg in session.messages
-            if not msg.blocked
-        ]
-        total_messages += len(messages)
-
-        session_responses.append(
-            ChatSessionResponse(
-                id=session.id,
-                child_id=session.child_id,
-                started_at=session.started_at,
-                ended_at=session.ended_at,
-                messages=messages
-            )
-        )
+            for session in sessions:
+                body = orjson.dumps(session.model_dump())
+                yield (b"," + body) if total_sessions else body
+                total_sessions += 1
+                total_messages += len(session.messages)
 
-    return ChatHistoryResponse(
-        sessions=session_responses,
-        total_sessions=len(sessions),
-        total_messages=total_messages
-    )
+            if len(sessions) < HISTORY_BATCH_SIZE:
+                break
+            cursor = (sessions[-1].started_at, sessions[-1].id)
+
+        yield b'],"total_sessions":' + orjson.dumps(total_sessions)
+        yield b',"total_messages":' + orjson.dumps(total_messages) + b"}"
+
+    return StreamingResponse(stream_history(), media_type="application/json")
 
 
 @router.get(
@@ -443,23 +560,19 @@ def get_own_chat_history(
     summary="Get current chat session",
     description="Get or create the current chat session."
 )
-def get_current_session(
+async def get_current_session(
     kid: Child = Depends(get_current_kid),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> ChatSessionResponse:
     """
     Get or create the current chat session.
 
     Returns the most recent open session or creates a new one.
     """
-    session = _get_or_create_session(kid.id, db)
+    session = await _get_or_create_session(kid.id, db)
 
-    # Get messages for this session (excluding blocked for kid's view)
-    messages = [
-        MessageResponse.model_validate(msg)
-        for msg in session.messages
-        if not msg.blocked
-    ]
+    # Blocked messages were already excluded when the session was loaded
+    messages = _MESSAGE_LIST.validate_python(session.messages, from_attributes=True)
 
     return ChatSessionResponse(
         id=session.id,
@@ -470,35 +583,116 @@ def get_current_session(
     )
 
 
-def _get_or_create_session(child_id, db: Session) -> ChatSession:
+async def _generate_and_store_title(
+    session_id: UUID,
+    provisional_title: str,
+    first_message: str
+) -> None:
+    """
+    Generate an AI title for a new session and store it.
+
+    Runs as a background task after the response is sent, using its own
+    database session since the request's session is gone by then.
+
+    Args:
+        session_id: UUID of the chat session
+        provisional_title: Title stored while the request was handled
+        first_message: First user message of the session
+    """
+    new_title = await generate_session_title([first_message])
+
+    async with AsyncSessionLocal() as db:
+        # Only replace the provisional title, never a newer one
+        await db.execute(
+            update(ChatSession).where(
+                ChatSession.id == session_id,
+                ChatSession.title == provisional_title
+            ).values(title=new_title)
+        )
+        await db.commit()
+
+
+async def _get_or_create_session(child_id, db: AsyncSession) -> ChatSession:
     """
     Get the current open session or create a new one.
 
+    Sessions are never closed, so several open sessions per child are
+    normal and a unique index can't arbitrate creation. Instead a
+    transaction-scoped advisory lock serializes creators for the same
+    child, and the lookup is repeated once the lock is held.
+
     Args:
         child_id: UUID of the child
         db: Database session
 
     Returns:
-        ChatSession instance
+        ChatSession instance whose messages collection holds only the
+        unblocked messages the kid may see
     """
-    # Look for an open session (no ended_at)
-    open_session = db.query(ChatSession).filter(
+    # Most recent open session (no ended_at); blocked messages are
+    # filtered out in the eager load itself
+    open_session_query = select(ChatSession).options(
+        selectinload(ChatSession.messages.and_(Message.blocked == False)),
+        raiseload("*")  # Any other relationship access must be loaded explicitly
+    ).where(
         ChatSession.child_id == child_id,
         ChatSession.ended_at.is_(None)
-    ).first()
+    ).order_by(desc(ChatSession.last_message_at)).limit(1)
+
+    open_session = (await db.execute(open_session_query)).scalars().first()
+    if open_session:
+        return open_session
 
+    # Only the bootstrap path pays for the lock; a concurrent request that
+    # got here first will have committed its session by the time we hold it
+    await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(str(child_id)))))
+    open_session = (await db.execute(open_session_query)).scalars().first()
     if open_session:
         return open_session
 
-    # Create new session
-    new_session = ChatSession(child_id=child_id)
+    # Create new session; the server-generated id comes back via RETURNING,
+    # so no refresh is needed and the empty messages collection stays loaded.
+    # Committing also releases the advisory lock.
+    new_session = ChatSession(child_id=child_id, messages=[])
     db.add(new_session)
-    db.commit()
-    db.refresh(new_session)
+    await db.commit()
 
     return new_session
 
 
+async def _record_session_preview(
+    db: AsyncSession,
+    session: ChatSession,
+    message: Message
+) -> None:
+    """
+    Store a session's preview from its first allowed user message.
+
+    The columns are written once and never touched again; the guarded
+    UPDATE keeps a concurrent first message from overwriting them.
+
+    Args:
+        db: Database session
+        session: The chat session the message belongs to
+        message: The flushed, allowed user message
+    """
+    if session.first_user_message_id is not None:
+        return
+
+    await db.execute(
+        update(ChatSession)
+        .where(
+            ChatSession.id == session.id,
+            ChatSession.first_user_message_id.is_(None)
+        )
+        .values(
+            first_user_message_id=message.id,
+            preview=message.content[:100]
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 # Chat Sessions Endpoints
 
 @router.get(
@@ -507,33 +701,25 @@ def _get_or_create_session(child_id, db: Session) -> ChatSession:
     summary="Get recent chat sessions",
     description="Get the most recent chat sessions for the authenticated kid."
 )
-def get_recent_chat_sessions(
+async def get_recent_chat_sessions(
     limit: int = Query(default=20, ge=1, le=100, description="Number of recent sessions to return"),
     kid: Child = Depends(get_current_kid),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> list[ChatSessionSummary]:
     """
     Get recent chat sessions for the authenticated kid.
 
     Returns sessions ordered by lastMessageAt descending.
     """
-    sessions = db.query(ChatSession).filter(
-        ChatSession.child_id == kid.id
-    ).order_by(desc(ChatSession.last_message_at)).limit(limit).all()
+    # Previews are stored on the session, so this is a single-table read
+    sessions = (await db.execute(
+        select(ChatSession).where(
+            ChatSession.child_id == kid.id
+        ).order_by(desc(ChatSession.last_message_at)).limit(limit)
+    )).scalars().all()
 
     summaries = []
     for session in sessions:
-        # Get preview from first user message
-        preview = None
-        first_user_message = db.query(Message).filter(
-            Message.session_id == session.id,
-            Message.role == MessageRole.USER,
-            Message.blocked == False
-        ).order_by(Message.created_at.asc()).first()
-
-        if first_user_message:
-            preview = first_user_message.content[:100] if len(first_user_message.content) > 100 else first_user_message.content
-
         # Handle case where last_message_at is None
         last_message_at = session.last_message_at or session.started_at
 
@@ -544,7 +730,7 @@ def get_recent_chat_sessions(
                 started_at=session.started_at,
                 last_message_at=last_message_at,
                 message_count=session.message_count or 0,
-                preview=preview
+                preview=session.preview
             )
         )
 
@@ -557,43 +743,43 @@ def get_recent_chat_sessions(
     summary="Get paginated chat sessions",
     description="Get paginated list of all chat sessions for the authenticated kid."
 )
-def get_paginated_chat_sessions(
+async def get_paginated_chat_sessions(
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=15, ge=1, le=50, description="Number of sessions per page"),
     kid: Child = Depends(get_current_kid),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> PaginatedChatSessions:
     """
     Get paginated list of all chat sessions for the authenticated kid.
 
     Returns sessions ordered by lastMessageAt descending with pagination info.
     """
-    # Get total count
-    total = db.query(ChatSession).filter(
-        ChatSession.child_id == kid.id
-    ).count()
-
     # Calculate offset
     offset = (page - 1) * page_size
 
-    # Get sessions for current page
-    sessions = db.query(ChatSession).filter(
-        ChatSession.child_id == kid.id
-    ).order_by(desc(ChatSession.last_message_at)).offset(offset).limit(page_size).all()
+    # Get sessions for current page; the total rides along as a window
+    # count so pagination is a single statement
+    rows = (await db.execute(
+        select(
+            ChatSession,
+            func.count().over().label("total")
+        ).where(
+            ChatSession.child_id == kid.id
+        ).order_by(desc(ChatSession.last_message_at)).offset(offset).limit(page_size)
+    )).all()
+
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Past the last page there are no rows to carry the window count
+        total = (await db.execute(
+            select(func.count(ChatSession.id)).where(ChatSession.child_id == kid.id)
+        )).scalar()
+    else:
+        total = 0
 
     summaries = []
-    for session in sessions:
-        # Get preview from first user message
-        preview = None
-        first_user_message = db.query(Message).filter(
-            Message.session_id == session.id,
-            Message.role == MessageRole.USER,
-            Message.blocked == False
-        ).order_by(Message.created_at.asc()).first()
-
-        if first_user_message:
-            preview = first_user_message.content[:100] if len(first_user_message.content) > 100 else first_user_message.content
-
+    for session, _ in rows:
         # Handle case where last_message_at is None
         last_message_at = session.last_message_at or session.started_at
 
@@ -604,7 +790,7 @@ def get_paginated_chat_sessions(
                 started_at=session.started_at,
                 last_message_at=last_message_at,
                 message_count=session.message_count or 0,
-                preview=preview
+                preview=session.preview
             )
         )
 
@@ -625,30 +811,36 @@ def get_paginated_chat_sessions(
     summary="Get full chat session",
     description="Get a full chat session with all messages."
 )
-def get_chat_session_by_id(
+async def get_chat_session_by_id(
     session_id: UUID,
     kid: Child = Depends(get_current_kid),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> FullChatSession:
     """
     Get a full chat session with all messages.
 
     Verifies that the session belongs to the authenticated kid.
     """
-    session = db.query(ChatSession).filter(
-        ChatSession.id == session_id,
-        ChatSession.child_id == kid.id
-    ).first()
+    session = (await db.execute(
+        select(ChatSession).options(
+            raiseload("*")  # Any relationship access must be loaded explicitly
+        ).where(
+            ChatSession.id == session_id,
+            ChatSession.child_id == kid.id
+        )
+    )).scalars().first()
 
     if not session:
         raise NotFoundError("Chat session not found or doesn't belong to you")
 
-    # Get all messages (excluding blocked from kid's view)
-    messages = [
-        MessageResponse.model_validate(msg)
-        for msg in session.messages
-        if not msg.blocked
-    ]
+    # Get all messages as column rows (excluding blocked from kid's view)
+    message_rows = (await db.execute(
+        select(*_MESSAGE_RESPONSE_COLUMNS).where(
+            Message.session_id == session.id,
+            Message.blocked == False
+        ).order_by(Message.created_at)
+    )).all()
+    messages = _MESSAGE_LIST.validate_python(message_rows, from_attributes=True)
 
     return FullChatSession(
         id=session.id,
@@ -668,9 +860,9 @@ def get_chat_session_by_id(
     summary="Create new chat session",
     description="Create a new empty chat session for the authenticated kid."
 )
-def create_chat_session(
+async def create_chat_session(
     kid: Child = Depends(get_current_kid),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> CreateChatSessionResponse:
     """
     Create a new empty chat session for the authenticated kid.
@@ -680,12 +872,10 @@ def create_chat_session(
     new_session = ChatSession(
         child_id=kid.id,
         title="New Chat",
-        last_message_at=datetime.utcnow(),
         message_count=0
     )
     db.add(new_session)
-    db.commit()
-    db.refresh(new_session)
+    await db.commit()
 
     return CreateChatSessionResponse(
         id=new_session.id,
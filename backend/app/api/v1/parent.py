@@ -4,14 +4,19 @@ Parent API endpoints.
 Handles child management, content rules, monitoring features, and parent chat.
 """
 from datetime import datetime
-from typing import List, Iterator
+from typing import List, AsyncIterator, Optional
 from uuid import UUID
 import json
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from app.api.deps import get_db, get_current_parent, verify_parent_owns_child
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select, func, desc, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from app.api.deps import get_db, get_current_parent, get_current_parent_child, invalidate_cached_kid
+from app.database import AsyncSessionLocal
 from app.models import Parent, Child, ContentRule, ParentChatSession, ParentMessage, MessageRole
 from app.schemas.child import ChildCreate, ChildUpdate, ChildResponse
 from app.schemas.content_rule import ContentRuleUpdate, ContentRuleResponse
@@ -25,16 +30,30 @@ from app.schemas.parent_chat import (
     CreateParentChatSessionResponse,
 )
 from app.core.security import hash_password
-from app.core.exceptions import NotFoundError, ConflictError
+from app.config import get_settings
+from app.core.exceptions import AuthorizationError, NotFoundError, ConflictError
+from app.core.pagination import encode_cursor, decode_cursor
 from app.services.ai_service import get_ai_response, get_ai_response_stream, AIService, generate_session_title
+from app.services.content_rule_service import (
+    content_rules_etag,
+    get_content_rules as load_content_rules,
+    invalidate_content_rules,
+)
 from app.services.insights_service import (
-    get_child_insights_dashboard,
+    get_cached_child_insights_dashboard,
+    invalidate_child_insights_dashboard,
     process_existing_messages,
 )
 from app.schemas.insights import ChildInsightsDashboard
 
+settings = get_settings()
+
 router = APIRouter(prefix="/parent", tags=["parent"])
 
+# Validate whole response lists in one pydantic-core call
+_MESSAGE_LIST = TypeAdapter(List[ParentMessageResponse])
+_CHILD_LIST = TypeAdapter(List[ChildResponse])
+
 
 @router.post(
     "/children",
@@ -43,31 +62,30 @@ router = APIRouter(prefix="/parent", tags=["parent"])
     summary="Create a child account",
     description="Create a new child account under the authenticated parent."
 )
-def create_child(
+async def create_child(
     data: ChildCreate,
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> ChildResponse:
     """
     Create a new child account.
 
     Creates a child with password, and name linked to the parent.
     """
-    # Check if email already exists
-    existing_child = db.query(Child).filter(Child.email == data.email).first()
-    if existing_child:
-        raise ConflictError("Email already exists")
-
     # Create child with hashed password
     new_child = Child(
         parent_id=parent.id,
         email=data.email,
-        password_hash=hash_password(data.password),
+        password_hash=await run_in_threadpool(hash_password, data.password),
         name=data.name
     )
     db.add(new_child)
-    db.commit()
-    db.refresh(new_child)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # The unique index on children.email rejects duplicates atomically,
+        # with no separate existence check to race against
+        raise ConflictError("Email already exists")
 
     return new_child
 
@@ -78,17 +96,28 @@ def create_child(
     summary="List all children",
     description="Get a list of all children under the authenticated parent."
 )
-def list_children(
+async def list_children(
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> List[ChildResponse]:
     """
     Get all children for the current parent.
 
     Returns a list of all child accounts created by this parent.
     """
-    children = db.query(Child).filter(Child.parent_id == parent.id).all()
-    return children
+    # Response columns only: no Child instances, and no password hashes
+    # leave the database
+    rows = (await db.execute(
+        select(
+            Child.id,
+            Child.parent_id,
+            Child.email,
+            Child.name,
+            Child.created_at,
+            Child.updated_at
+        ).where(Child.parent_id == parent.id)
+    )).all()
+    return _CHILD_LIST.validate_python(rows, from_attributes=True)
 
 
 @router.put(
@@ -97,29 +126,25 @@ def list_children(
     summary="Update child information",
     description="Update a child's name or password."
 )
-def update_child(
-    child_id: UUID,
+async def update_child(
     data: ChildUpdate,
-    parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    child: Child = Depends(get_current_parent_child),
+    db: AsyncSession = Depends(get_db)
 ) -> ChildResponse:
     """
     Update child account information.
 
     Parent can update the child's name or password.
     """
-    # Verify parent owns this child
-    child = verify_parent_owns_child(parent, child_id, db)
-
     # Update fields if provided
     if data.name is not None:
         child.name = data.name
 
     if data.password is not None:
-        child.password_hash = hash_password(data.password)
+        child.password_hash = await run_in_threadpool(hash_password, data.password)
 
-    db.commit()
-    db.refresh(child)
+    await db.commit()
+    await invalidate_cached_kid(child.id)
 
     return child
 
@@ -130,21 +155,29 @@ def update_child(
     summary="Delete child account",
     description="Delete a child account and all associated data."
 )
-def delete_child(
+async def delete_child(
     child_id: UUID,
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> None:
     """
     Delete a child account.
 
-    Removes the child and all their chat history (cascade delete).
+    Removes the child and all their chat history. Ownership is checked in
+    the DELETE itself and the history goes through the database's ON
+    DELETE CASCADE, so nothing is loaded into the session first.
+
+    Raises:
+        AuthorizationError: If the child doesn't belong to this parent
     """
-    # Verify parent owns this child
-    child = verify_parent_owns_child(parent, child_id, db)
+    result = await db.execute(
+        delete(Child).where(Child.id == child_id, Child.parent_id == parent.id)
+    )
+    if result.rowcount == 0:
+        raise AuthorizationError("You do not have access to this child's data")
 
-    db.delete(child)
-    db.commit()
+    await db.commit()
+    await invalidate_cached_kid(child_id)
 
 
 @router.get(
@@ -153,22 +186,28 @@ def delete_child(
     summary="Get content rules",
     description="Get the current content filtering rules."
 )
-def get_content_rules(
-    parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+async def get_content_rules(
+    request: Request,
+    response: Response,
+    parent: Parent = Depends(get_current_parent)
 ) -> ContentRuleResponse:
     """
     Get current content rules.
 
-    Returns the parent's content filtering configuration.
+    Returns the parent's content filtering configuration. Reads go
+    through the same cache as kid chat filtering, and a matching
+    If-None-Match gets a bodiless 304.
     """
-    rules = db.query(ContentRule).filter(
-        ContentRule.parent_id == parent.id
-    ).first()
+    rules = await load_content_rules(parent.id)
 
     if not rules:
         raise NotFoundError("Content rules")
 
+    etag = content_rules_etag(rules)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return rules
 
 
@@ -178,19 +217,20 @@ def get_content_rules(
     summary="Update content rules",
     description="Update content filtering rules (allowlist or blocklist mode)."
 )
-def update_content_rules(
+async def update_content_rules(
     data: ContentRuleUpdate,
+    response: Response,
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> ContentRuleResponse:
     """
     Update content filtering rules.
 
     Set the filtering mode (allowlist/blocklist) and topics/keywords.
     """
-    rules = db.query(ContentRule).filter(
-        ContentRule.parent_id == parent.id
-    ).first()
+    rules = (await db.execute(
+        select(ContentRule).where(ContentRule.parent_id == parent.id)
+    )).scalars().first()
 
     if not rules:
         raise NotFoundError("Content rules")
@@ -200,9 +240,12 @@ def update_content_rules(
     rules.topics = data.topics
     rules.keywords = data.keywords
 
-    db.commit()
-    db.refresh(rules)
+    await db.commit()
+
+    # Kid chat reads rules through the cache; drop the stale copy
+    await invalidate_content_rules(parent.id)
 
+    response.headers["ETag"] = content_rules_etag(rules)
     return rules
 
 
@@ -214,10 +257,9 @@ def update_content_rules(
     summary="Get child insights dashboard",
     description="Get learning insights and analytics for a specific child without accessing actual conversations."
 )
-def get_child_insights(
-    child_id: UUID,
-    parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+async def get_child_insights(
+    child: Child = Depends(get_current_parent_child),
+    db: AsyncSession = Depends(get_db)
 ) -> ChildInsightsDashboard:
     """
     Get insights dashboard for a child.
@@ -230,14 +272,9 @@ def get_child_insights(
 
     This endpoint provides insights without exposing actual conversation content.
     """
-    # Verify parent owns this child
-    child = verify_parent_owns_child(parent, child_id, db)
-
-    # Process any unprocessed messages first
-    process_existing_messages(db, child.id)
-
-    # Get the insights dashboard
-    return get_child_insights_dashboard(db, child)
+    # Served from cache for a few minutes; a miss processes any new
+    # messages and recomputes the aggregates
+    return await get_cached_child_insights_dashboard(db, child)
 
 
 @router.post(
@@ -246,10 +283,9 @@ def get_child_insights(
     summary="Refresh child insights",
     description="Process any new messages and regenerate insights for a child."
 )
-def refresh_child_insights(
-    child_id: UUID,
-    parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+async def refresh_child_insights(
+    child: Child = Depends(get_current_parent_child),
+    db: AsyncSession = Depends(get_db)
 ) -> dict:
     """
     Refresh insights by processing new messages.
@@ -260,11 +296,9 @@ def refresh_child_insights(
     Returns:
         Count of newly processed messages
     """
-    # Verify parent owns this child
-    child = verify_parent_owns_child(parent, child_id, db)
-
     # Process unprocessed messages
-    processed_count = process_existing_messages(db, child.id)
+    processed_count = await process_existing_messages(db, child.id)
+    await invalidate_child_insights_dashboard(child.id)
 
     return {
         "message": f"Successfully processed {processed_count} new messages",
@@ -280,10 +314,11 @@ def refresh_child_insights(
     summary="Send a chat message",
     description="Send a message to the AI as a parent (no content filtering)."
 )
-def send_parent_chat_message(
+async def send_parent_chat_message(
     data: ParentChatMessageRequest,
+    background_tasks: BackgroundTasks,
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> ParentChatResponse:
     """
     Send a chat message to the AI as a parent.
@@ -298,75 +333,100 @@ def send_parent_chat_message(
     Returns:
         ParentChatResponse with user message, AI response, sessionId, and sessionTitle
     """
-    # Get or create chat session
     if data.session_id:
         # Verify session belongs to this parent
-        current_session = db.query(ParentChatSession).filter(
-            ParentChatSession.id == data.session_id,
-            ParentChatSession.parent_id == parent.id
-        ).first()
+        current_session = (await db.execute(
+            select(ParentChatSession).where(
+                ParentChatSession.id == data.session_id,
+                ParentChatSession.parent_id == parent.id
+            )
+        )).scalars().first()
         if not current_session:
             raise NotFoundError("Chat session not found or doesn't belong to you")
+
+        # Get recent conversation history for context (bounded to the AI's
+        # context window); only the columns the prompt needs are read
+        recent_messages = (await db.execute(
+            select(ParentMessage.role, ParentMessage.content).where(
+                ParentMessage.session_id == current_session.id
+            ).order_by(ParentMessage.created_at.desc()).limit(settings.AI_CONTEXT_MESSAGES)
+        )).all()
+        recent_messages.reverse()
+
+        # Nothing is written before the AI replies; ending the read-only
+        # transaction hands the connection back for the whole model call
+        await db.commit()
     else:
-        # Create a new session
+        # A new session has no history; it is created with the messages
+        current_session = None
+        recent_messages = []
+
+    # Format history for AI
+    conversation_history = _format_parent_history(recent_messages)
+
+    # The user message is stored with the reply, stamped now so it still
+    # sorts first
+    received_at = datetime.utcnow()
+
+    # Get AI response (awaited on the shared async client)
+    ai_response_text = await get_ai_response(data.message, conversation_history)
+
+    if current_session is None:
         current_session = ParentChatSession(
             parent_id=parent.id,
             title="New Chat",
-            last_message_at=datetime.utcnow(),
             message_count=0
         )
         db.add(current_session)
-        db.commit()
-        db.refresh(current_session)
-
-    # Save user message (no content filtering for parents)
-    user_message = ParentMessage(
-        session_id=current_session.id,
-        role=MessageRole.USER,
-        content=data.message
-    )
-    db.add(user_message)
-    db.commit()
-    db.refresh(user_message)
-
-    # Get conversation history for context
-    session_messages = db.query(ParentMessage).filter(
-        ParentMessage.session_id == current_session.id
-    ).order_by(ParentMessage.created_at.asc()).all()
-
-    # Format history for AI (exclude the current message we just added)
-    conversation_history = _format_parent_history(session_messages[:-1])
-
-    # Get AI response
-    ai_response_text = get_ai_response(data.message, conversation_history)
-
-    # Save AI response
-    assistant_message = ParentMessage(
-        session_id=current_session.id,
-        role=MessageRole.ASSISTANT,
-        content=ai_response_text
-    )
-    db.add(assistant_message)
-
-    # Update session metadata
-    current_session.last_message_at = datetime.utcnow()
-    current_session.message_count += 2  # Both user and assistant messages
+        # Flush for the server-generated id; the whole turn commits once below
+        await db.flush()
+
+    # Save both messages (no content filtering for parents) in one
+    # multi-row INSERT ... RETURNING. Ids are generated by the database and
+    # the table has no insert sentinel, so the ORM unit of work would send
+    # one INSERT per row; a Core insert gets both rows back in one trip.
+    message_rows = (await db.execute(
+        insert(ParentMessage).values([
+            {
+                "session_id": current_session.id,
+                "role": MessageRole.USER,
+                "content": data.message,
+                "created_at": received_at
+            },
+            {
+                "session_id": current_session.id,
+                "role": MessageRole.ASSISTANT,
+                "content": ai_response_text,
+                "created_at": datetime.utcnow()
+            }
+        ]).returning(
+            ParentMessage.id,
+            ParentMessage.session_id,
+            ParentMessage.role,
+            ParentMessage.content,
+            ParentMessage.created_at
+        )
+    )).all()
+    # RETURNING order isn't guaranteed; tell the rows apart by role
+    messages_by_role = {row.role: row for row in message_rows}
+    user_message = messages_by_role[MessageRole.USER]
+    assistant_message = messages_by_role[MessageRole.ASSISTANT]
 
-    # Generate title after first user message if still default
     session_title = current_session.title
-    user_messages_in_session = [
-        msg.content for msg in session_messages if msg.role == MessageRole.USER
-    ]
-
-    # Generate title after first user message if still default
-    if len(user_messages_in_session) == 1:
-        # Generate AI title
-        new_title = generate_session_title(user_messages_in_session)
+    # Generate title after first user message if still default (the
+    # title stays "New Chat" until then, so no message scan is needed)
+    if current_session.title in (None, "New Chat"):
+        # Use the message as a provisional title; the AI title is generated
+        # after the response is sent
+        new_title = data.message[:255]
         current_session.title = new_title
         session_title = new_title
+        background_tasks.add_task(
+            _generate_and_store_title, current_session.id, new_title, data.message
+        )
 
-    db.commit()
-    db.refresh(assistant_message)
+    # Single commit for the session, both messages and the title
+    await db.commit()
 
     return ParentChatResponse(
         user_message=ParentMessageResponse.model_validate(user_message),
@@ -383,8 +443,9 @@ def send_parent_chat_message(
 )
 async def send_parent_chat_message_stream(
     data: ParentChatMessageRequest,
+    background_tasks: BackgroundTasks,
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> StreamingResponse:
     """
     Send a chat message to the AI with streaming response.
@@ -398,16 +459,18 @@ async def send_parent_chat_message_stream(
     Returns:
         StreamingResponse with Server-Sent Events
     """
-    def generate_stream() -> Iterator[str]:
+    async def generate_stream() -> AsyncIterator[str]:
         """Generate SSE stream."""
         try:
             # Get or create chat session
             if data.session_id:
                 # Verify session belongs to this parent
-                current_session = db.query(ParentChatSession).filter(
-                    ParentChatSession.id == data.session_id,
-                    ParentChatSession.parent_id == parent.id
-                ).first()
+                current_session = (await db.execute(
+                    select(ParentChatSession).where(
+                        ParentChatSession.id == data.session_id,
+                        ParentChatSession.parent_id == parent.id
+                    )
+                )).scalars().first()
                 if not current_session:
                     yield f"event: error\ndata: {json.dumps({'error': 'Chat session not found or does not belong to you'})}\n\n"
                     return
@@ -416,37 +479,40 @@ async def send_parent_chat_message_stream(
                 current_session = ParentChatSession(
                     parent_id=parent.id,
                     title="New Chat",
-                    last_message_at=datetime.utcnow(),
                     message_count=0
                 )
                 db.add(current_session)
-                db.commit()
-                db.refresh(current_session)
-
-            # Save user message (no content filtering for parents)
+                # Flush for the server-generated id; committed with the user message
+                await db.flush()
+
+            # Get recent conversation history for context (bounded to the AI's
+            # context window) before the new message is written, so it needs
+            # no exclusion; only the columns the prompt needs are read
+            recent_messages = (await db.execute(
+                select(ParentMessage.role, ParentMessage.content).where(
+                    ParentMessage.session_id == current_session.id
+                ).order_by(ParentMessage.created_at.desc()).limit(settings.AI_CONTEXT_MESSAGES)
+            )).all()
+            recent_messages.reverse()
+            conversation_history = _format_parent_history(recent_messages)
+
+            # Save user message (no content filtering for parents); one commit
+            # covers it and any new session, and releases the connection
+            # while the AI streams
             user_message = ParentMessage(
                 session_id=current_session.id,
                 role=MessageRole.USER,
                 content=data.message
             )
             db.add(user_message)
-            db.commit()
-            db.refresh(user_message)
+            await db.commit()
 
             # Send user message event
             yield f"event: user_message\ndata: {json.dumps({'id': str(user_message.id), 'content': data.message, 'session_id': str(current_session.id)})}\n\n"
 
-            # Get conversation history for context
-            session_messages = db.query(ParentMessage).filter(
-                ParentMessage.session_id == current_session.id
-            ).order_by(ParentMessage.created_at.asc()).all()
-
-            # Format history for AI (exclude the current message we just added)
-            conversation_history = _format_parent_history(session_messages[:-1])
-
             # Stream AI response
             full_response = ""
-            for chunk in get_ai_response_stream(data.message, conversation_history):
+            async for chunk in get_ai_response_stream(data.message, conversation_history):
                 full_response += chunk
                 # Send chunk event
                 yield f"event: chunk\ndata: {json.dumps({'content': chunk})}\n\n"
@@ -459,23 +525,21 @@ async def send_parent_chat_message_stream(
             )
             db.add(assistant_message)
 
-            # Update session metadata
-            current_session.last_message_at = datetime.utcnow()
-            current_session.message_count += 2  # Both user and assistant messages
-
             # Generate title after first user message if still default
             session_title = current_session.title
-            user_messages_in_session = [
-                msg.content for msg in session_messages if msg.role == MessageRole.USER
-            ]
-
-            if len(user_messages_in_session) == 1:
-                new_title = generate_session_title(user_messages_in_session)
+            # Title stays at the default until the first user message, so no
+            # scan of the session's messages is needed
+            if current_session.title in (None, "New Chat"):
+                # Provisional title now; the AI title is generated once the
+                # stream has finished
+                new_title = data.message[:255]
                 current_session.title = new_title
                 session_title = new_title
+                background_tasks.add_task(
+                    _generate_and_store_title, current_session.id, new_title, data.message
+                )
 
-            db.commit()
-            db.refresh(assistant_message)
+            await db.commit()
 
             # Send done event with message ID
             yield f"event: done\ndata: {json.dumps({'id': str(assistant_message.id), 'content': full_response, 'session_id': str(current_session.id), 'session_title': session_title})}\n\n"
@@ -495,12 +559,41 @@ async def send_parent_chat_message_stream(
     )
 
 
+async def _generate_and_store_title(
+    session_id: UUID,
+    provisional_title: str,
+    first_message: str
+) -> None:
+    """
+    Generate an AI title for a new parent session and store it.
+
+    Runs as a background task after the response is sent, using its own
+    database session since the request's session is gone by then.
+
+    Args:
+        session_id: UUID of the parent chat session
+        provisional_title: Title stored while the request was handled
+        first_message: First user message of the session
+    """
+    new_title = await generate_session_title([first_message])
+
+    async with AsyncSessionLocal() as db:
+        # Only replace the provisional title, never a newer one
+        await db.execute(
+            update(ParentChatSession).where(
+                ParentChatSession.id == session_id,
+                ParentChatSession.title == provisional_title
+            ).values(title=new_title)
+        )
+        await db.commit()
+
+
 def _format_parent_history(messages: List[ParentMessage]) -> list:
     """
     Format parent messages into conversation history for AI.
 
     Args:
-        messages: List of ParentMessage objects
+        messages: ParentMessage objects or rows with role and content
 
     Returns:
         List of message dicts suitable for AI service
@@ -514,38 +607,59 @@ def _format_parent_history(messages: List[ParentMessage]) -> list:
     return history
 
 
+def _first_user_message_preview(session_entity=ParentChatSession):
+    """
+    Build a correlated column with each session's first-message preview.
+
+    Selected alongside ParentChatSession so listing endpoints fetch sessions
+    and previews in one statement, truncated in SQL.
+
+    Args:
+        session_entity: ParentChatSession entity (or alias) to correlate against
+
+    Returns:
+        Labelled scalar subquery yielding up to 100 characters of the
+        session's earliest user message (NULL if none)
+    """
+    return (
+        select(func.substr(ParentMessage.content, 1, 100))
+        .where(
+            ParentMessage.session_id == session_entity.id,
+            ParentMessage.role == MessageRole.USER
+        )
+        .order_by(ParentMessage.created_at.asc())
+        .limit(1)
+        .correlate(session_entity)
+        .scalar_subquery()
+        .label("preview")
+    )
+
+
 @router.get(
     "/chat-sessions/recent",
     response_model=list[ParentChatSessionSummary],
     summary="Get recent chat sessions",
     description="Get the most recent chat sessions for the authenticated parent."
 )
-def get_recent_parent_chat_sessions(
+async def get_recent_parent_chat_sessions(
     limit: int = Query(default=20, ge=1, le=100, description="Number of recent sessions to return"),
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> list[ParentChatSessionSummary]:
     """
     Get recent chat sessions for the authenticated parent.
 
     Returns sessions ordered by lastMessageAt descending.
     """
-    sessions = db.query(ParentChatSession).filter(
-        ParentChatSession.parent_id == parent.id
-    ).order_by(desc(ParentChatSession.last_message_at)).limit(limit).all()
+    # Sessions and their previews in one statement
+    rows = (await db.execute(
+        select(ParentChatSession, _first_user_message_preview()).where(
+            ParentChatSession.parent_id == parent.id
+        ).order_by(desc(ParentChatSession.last_message_at)).limit(limit)
+    )).all()
 
     summaries = []
-    for session in sessions:
-        # Get preview from first user message
-        preview = None
-        first_user_message = db.query(ParentMessage).filter(
-            ParentMessage.session_id == session.id,
-            ParentMessage.role == MessageRole.USER
-        ).order_by(ParentMessage.created_at.asc()).first()
-
-        if first_user_message:
-            preview = first_user_message.content[:100] if len(first_user_message.content) > 100 else first_user_message.content
-
+    for session, preview in rows:
         # Handle case where last_message_at is None
         last_message_at = session.last_message_at or session.started_at
 
@@ -569,64 +683,83 @@ def get_recent_parent_chat_sessions(
     summary="Get paginated chat sessions",
     description="Get paginated list of all chat sessions for the authenticated parent."
 )
-def get_paginated_parent_chat_sessions(
-    page: int = Query(default=1, ge=1, description="Page number"),
+async def get_paginated_parent_chat_sessions(
+    page: int = Query(default=1, ge=1, description="Page number (ignored when cursor is set)"),
     page_size: int = Query(default=15, ge=1, le=50, description="Number of sessions per page"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    include_total: bool = Query(default=True, description="Whether to count all sessions"),
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> PaginatedParentChatSessions:
     """
     Get paginated list of all chat sessions for the authenticated parent.
 
     Returns sessions ordered by lastMessageAt descending with pagination info.
+    Passing the previous page's next_cursor seeks straight past it, so deep
+    pages cost the same as the first; page numbers still work via OFFSET.
     """
-    # Get total count
-    total = db.query(ParentChatSession).filter(
-        ParentChatSession.parent_id == parent.id
-    ).count()
-
-    # Calculate offset
-    offset = (page - 1) * page_size
-
-    # Get sessions for current page
-    sessions = db.query(ParentChatSession).filter(
+    filters = [ParentChatSession.parent_id == parent.id]
+    if cursor:
+        filters.append(
+            tuple_(ParentChatSession.last_message_at, ParentChatSession.id) < decode_cursor(cursor)
+        )
+        offset = 0
+    else:
+        offset = (page - 1) * page_size
+
+    # One row past the page tells whether another page follows. Previews
+    # are computed outside the paged subquery so they only run for the
+    # returned rows.
+    page_query = select(ParentChatSession).where(*filters).order_by(
+        desc(ParentChatSession.last_message_at),
+        desc(ParentChatSession.id)
+    ).offset(offset).limit(page_size + 1).subquery()
+    page_session = aliased(ParentChatSession, page_query)
+
+    columns = [page_session, _first_user_message_preview(page_session)]
+    count_query = select(func.count(ParentChatSession.id)).where(
         ParentChatSession.parent_id == parent.id
-    ).order_by(desc(ParentChatSession.last_message_at)).offset(offset).limit(page_size).all()
-
-    summaries = []
-    for session in sessions:
-        # Get preview from first user message
-        preview = None
-        first_user_message = db.query(ParentMessage).filter(
-            ParentMessage.session_id == session.id,
-            ParentMessage.role == MessageRole.USER
-        ).order_by(ParentMessage.created_at.asc()).first()
-
-        if first_user_message:
-            preview = first_user_message.content[:100] if len(first_user_message.content) > 100 else first_user_message.content
-
-        # Handle case where last_message_at is None
-        last_message_at = session.last_message_at or session.started_at
-
-        summaries.append(
-            ParentChatSessionSummary(
-                id=session.id,
-                title=session.title or "New Chat",
-                started_at=session.started_at,
-                last_message_at=last_message_at,
-                message_count=session.message_count or 0,
-                preview=preview
-            )
+    )
+    if include_total:
+        # Uncorrelated, so Postgres evaluates it once for the whole statement
+        columns.append(count_query.scalar_subquery().label("total"))
+
+    rows = (await db.execute(
+        select(*columns).order_by(desc(page_session.last_message_at), desc(page_session.id))
+    )).all()
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    total = None
+    if include_total:
+        # Past the last page there are no rows to carry the count
+        total = rows[0].total if rows else (await db.execute(count_query)).scalar()
+
+    summaries = [
+        ParentChatSessionSummary(
+            id=row[0].id,
+            title=row[0].title or "New Chat",
+            started_at=row[0].started_at,
+            last_message_at=row[0].last_message_at,
+            message_count=row[0].message_count or 0,
+            preview=row.preview
         )
+        for row in rows
+    ]
 
-    has_more = offset + page_size < total
+    next_cursor = None
+    if has_more:
+        last_session = rows[-1][0]
+        next_cursor = encode_cursor(last_session.last_message_at, last_session.id)
 
     return PaginatedParentChatSessions(
         sessions=summaries,
         total=total,
-        page=page,
+        page=None if cursor else page,
         page_size=page_size,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
     )
 
 
@@ -636,29 +769,48 @@ def get_paginated_parent_chat_sessions(
     summary="Get full chat session",
     description="Get a full chat session with all messages."
 )
-def get_parent_chat_session_by_id(
+async def get_parent_chat_session_by_id(
     session_id: UUID,
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> FullParentChatSession:
     """
     Get a full chat session with all messages.
 
     Verifies that the session belongs to the authenticated parent.
     """
-    session = db.query(ParentChatSession).filter(
-        ParentChatSession.id == session_id,
-        ParentChatSession.parent_id == parent.id
-    ).first()
+    # Session and message columns only; nothing here needs ORM instances
+    session = (await db.execute(
+        select(
+            ParentChatSession.id,
+            ParentChatSession.parent_id,
+            ParentChatSession.title,
+            ParentChatSession.started_at,
+            ParentChatSession.ended_at,
+            ParentChatSession.last_message_at,
+            ParentChatSession.message_count
+        ).where(
+            ParentChatSession.id == session_id,
+            ParentChatSession.parent_id == parent.id
+        )
+    )).first()
 
     if not session:
         raise NotFoundError("Chat session not found or doesn't belong to you")
 
     # Get all messages
-    messages = [
-        ParentMessageResponse.model_validate(msg)
-        for msg in session.messages
-    ]
+    message_rows = (await db.execute(
+        select(
+            ParentMessage.id,
+            ParentMessage.session_id,
+            ParentMessage.role,
+            ParentMessage.content,
+            ParentMessage.created_at
+        ).where(
+            ParentMessage.session_id == session.id
+        ).order_by(ParentMessage.created_at)
+    )).all()
+    messages = _MESSAGE_LIST.validate_python(message_rows, from_attributes=True)
 
     return FullParentChatSession(
         id=session.id,
@@ -678,9 +830,9 @@ def get_parent_chat_session_by_id(
     summary="Create new chat session",
     description="Create a new empty chat session for the authenticated parent."
 )
-def create_parent_chat_session(
+async def create_parent_chat_session(
     parent: Parent = Depends(get_current_parent),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> CreateParentChatSessionResponse:
     """
     Create a new empty chat session for the authenticated parent.
@@ -690,12 +842,10 @@ def create_parent_chat_session(
     new_session = ParentChatSession(
         parent_id=parent.id,
         title="New Chat",
-        last_message_at=datetime.utcnow(),
         message_count=0
     )
     db.add(new_session)
-    db.commit()
-    db.refresh(new_session)
+    await db.commit()
 
     return CreateParentChatSessionResponse(
         id=new_session.id,
@@ -18,6 +18,11 @@ class Settings(BaseSettings):
 
     # Database (required - must be set via environment variable or .env file)
     DATABASE_URL: str
+    # Set when DATABASE_URL points at PgBouncer in transaction pooling mode
+    DATABASE_USE_PGBOUNCER: bool = False
+
+    # Redis (optional - cross-request caching is disabled when unset)
+    REDIS_URL: str = ""
 
     # JWT Configuration
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
@@ -25,6 +30,10 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Password hashing work factor (log2 of bcrypt iterations); each step
+    # doubles hashing time. Existing hashes keep verifying after a change.
+    BCRYPT_ROUNDS: int = 12
+
     # OpenAI Configuration
     OPENAI_API_KEY: str = ""
 
@@ -37,6 +46,9 @@ class Settings(BaseSettings):
     # AI Provider Selection (openai, gemini, or auto)
     AI_PROVIDER: str = "auto"
 
+    # Most recent prior messages sent to the AI as conversation context
+    AI_CONTEXT_MESSAGES: int = 20
+
     # CORS Configuration
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
 
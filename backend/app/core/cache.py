@@ -0,0 +1,70 @@
+"""
+Shared Redis client for cross-request caching.
+
+Caching is optional: when REDIS_URL is not configured the client is None
+and callers fall back to the database.
+"""
+import logging
+from typing import Optional
+import redis.asyncio as redis
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Module-level client; redis-py keeps its own connection pool
+redis_client: Optional[redis.Redis] = (
+    redis.from_url(settings.REDIS_URL) if settings.REDIS_URL else None
+)
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """
+    Read a cached value.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached bytes, or None on a miss, when caching is disabled, or if
+        Redis is unreachable
+    """
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except redis.RedisError as exc:
+        logger.warning(f"Redis get failed for {key}: {exc}")
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl_seconds: int) -> None:
+    """
+    Store a value with an expiry. Failures are logged and ignored.
+
+    Args:
+        key: Cache key
+        value: Serialized value
+        ttl_seconds: Time to live in seconds
+    """
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(key, value, ex=ttl_seconds)
+    except redis.RedisError as exc:
+        logger.warning(f"Redis set failed for {key}: {exc}")
+
+
+async def cache_delete(key: str) -> None:
+    """
+    Invalidate a cached value. Failures are logged and ignored.
+
+    Args:
+        key: Cache key
+    """
+    if redis_client is None:
+        return
+    try:
+        await redis_client.delete(key)
+    except redis.RedisError as exc:
+        logger.warning(f"Redis delete failed for {key}: {exc}")
@@ -0,0 +1,45 @@
+"""
+Keyset pagination cursors.
+
+A cursor records the sort key of the last row a client has seen, as
+"<timestamp>_<row id>", so the next page seeks past it instead of
+skipping rows with OFFSET.
+"""
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+from app.core.exceptions import ValidationError
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """
+    Encode a (timestamp, id) sort key as an opaque cursor.
+
+    Args:
+        timestamp: Sort timestamp of the last row returned
+        row_id: Id of the last row returned, the tiebreaker for equal timestamps
+
+    Returns:
+        Cursor string to hand back to the client
+    """
+    return f"{timestamp.isoformat()}_{row_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string sent by the client
+
+    Returns:
+        Tuple of (timestamp, row id)
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        timestamp, row_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except ValueError:
+        raise ValidationError("Invalid pagination cursor")
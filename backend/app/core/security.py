@@ -1,17 +1,26 @@
 """
 Security utilities for JWT token handling and password hashing.
 """
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Optional, Dict, Any
 from uuid import UUID
-from jose import jwt, JWTError
+import jwt
 from passlib.context import CryptContext
 from app.config import get_settings
 
 settings = get_settings()
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# HMAC key bytes, encoded once rather than on every sign/verify
+_JWT_KEY = settings.SECRET_KEY.encode()
+
+# Password hashing context using bcrypt. Hashing and verifying are CPU-bound,
+# so async callers run them through run_in_threadpool.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 
 def hash_password(password: str) -> str:
@@ -55,11 +64,11 @@ def create_access_token(
         Encoded JWT token string
     """
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        lifetime = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    # exp is NumericDate (epoch seconds) on the wire anyway
+    expire = int(time.time()) + lifetime
 
     to_encode: Dict[str, Any] = {
         "sub": str(user_id),
@@ -71,7 +80,7 @@ def create_access_token(
 
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
+        _JWT_KEY,
         algorithm=settings.ALGORITHM
     )
     return encoded_jwt
@@ -93,7 +102,7 @@ def create_refresh_token(
     Returns:
         Encoded refresh token string
     """
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int(time.time()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
 
     to_encode: Dict[str, Any] = {
         "sub": str(user_id),
@@ -105,7 +114,7 @@ def create_refresh_token(
 
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
+        _JWT_KEY,
         algorithm=settings.ALGORITHM
     )
     return encoded_jwt
@@ -124,11 +133,11 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
+            _JWT_KEY,
             algorithms=[settings.ALGORITHM]
         )
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
@@ -1,40 +1,76 @@
 """
 Database connection and session management.
 
-Provides SQLAlchemy engine and session factory for PostgreSQL database.
+Provides async SQLAlchemy engine and session factory for PostgreSQL database.
 """
-from sqlalchemy import create_engine
+from typing import AsyncGenerator
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.config import get_settings
 
 settings = get_settings()
 
-# Create SQLAlchemy engine with connection pooling
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,  # Verify connections before using
-    echo=settings.DEBUG  # Log SQL queries in debug mode
-)
+# Compiled-SQL cache entries per engine (SQLAlchemy's default is 500).
+# Multi-row VALUES upserts compile once per row count, so the headroom
+# keeps them from evicting the hot chat and auth statements.
+QUERY_CACHE_SIZE = 1200
+
+# The app talks to Postgres through asyncpg; migrations keep using the
+# configured sync driver, so only the driver name is swapped here.
+ASYNC_DATABASE_URL = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if settings.DATABASE_USE_PGBOUNCER:
+    # PgBouncer already multiplexes server connections, so keeping a pool
+    # per worker only multiplies idle connections. Prepared statements
+    # don't survive transaction pooling, so asyncpg's caches are disabled.
+    engine = create_async_engine(
+        ASYNC_DATABASE_URL.update_query_dict({"prepared_statement_cache_size": "0"}),
+        poolclass=NullPool,
+        connect_args={"statement_cache_size": 0},
+        query_cache_size=QUERY_CACHE_SIZE,
+        echo=settings.DEBUG  # Log SQL queries in debug mode
+    )
+else:
+    # Create async SQLAlchemy engine with connection pooling
+    engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        pool_size=20,
+        max_overflow=40,  # Headroom for bursts instead of queueing on checkout
+        pool_recycle=1800,  # Recycle connections every 30 minutes to avoid stale server-side sessions
+        pool_pre_ping=True,  # Verify connections before using
+        query_cache_size=QUERY_CACHE_SIZE,
+        echo=settings.DEBUG  # Log SQL queries in debug mode
+    )
+
+# Create session factory. Server-generated columns (ids, timestamps) come
+# back through INSERT ... RETURNING and commits don't expire loaded state,
+# so handlers never need a refresh() round trip after writing.
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
 
-def get_db():
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides database session.
 
     Yields a database session and ensures it's closed after use.
     Use this as a FastAPI dependency in route handlers.
     """
-    db = SessionLocal()
+    db = AsyncSessionLocal()
     try:
         yield db
+    except Exception:
+        # Don't hand a connection with a failed transaction back to the pool
+        await db.rollback()
+        raise
     finally:
-        db.close()
+        await db.close()
@@ -4,15 +4,23 @@ Main FastAPI application entry point.
 Sets up the FastAPI app with all routes, middleware, and configurations.
 """
 import logging
-from fastapi import FastAPI, Request, status
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+import orjson
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIMiddleware
+from sqlalchemy import text
 from app.config import get_settings
+from app.core.cache import redis_client
+from app.database import engine
 from app.api.v1 import auth, parent, kid
+from app.services.ai_service import ai_service
 
 # Configure logging
 logging.basicConfig(
@@ -23,8 +31,54 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Initialize rate limiter. Every route gets the per-IP default limit via
+# SlowAPIMiddleware below. Counters live in Redis when it's configured so
+# every worker enforces one shared limit; otherwise each worker counts in
+# memory on its own.
+limiter = Limiter(
+    key_func=get_remote_address,
+    default_limits=[f"{settings.RATE_LIMIT_PER_MINUTE}/minute"],
+    storage_uri=settings.REDIS_URL or "memory://",
+    strategy="fixed-window",
+    # A Redis outage degrades to per-worker counting instead of failing requests
+    in_memory_fallback_enabled=bool(settings.REDIS_URL),
+)
+
+
+# Startup and shutdown
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Warm shared connections on startup and release them on shutdown.
+
+    The first database connection also runs SQLAlchemy's dialect setup,
+    so doing it here keeps that cost off the first request. Failures are
+    only logged: the app still starts, and connects lazily as before.
+    """
+    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
+    logger.info(f"Debug mode: {settings.DEBUG}")
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as exc:
+        logger.warning(f"Database warm-up failed: {exc}")
+
+    if redis_client is not None:
+        try:
+            await redis_client.ping()
+        except Exception as exc:
+            logger.warning(f"Redis warm-up failed: {exc}")
+
+    logger.info("Application startup complete")
+    yield
+
+    logger.info("Application shutting down...")
+    await ai_service.aclose()
+    if redis_client is not None:
+        await redis_client.aclose()
+    await engine.dispose()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -33,11 +87,16 @@ app = FastAPI(
     description="A kid-safe conversational AI API with parental controls",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson encodes UUIDs and datetimes natively and is much faster than
+    # the stdlib encoder on large nested payloads like chat histories
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add rate limiter to app state
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+app.add_middleware(SlowAPIMiddleware)
 
 # Configure CORS
 app.add_middleware(
@@ -54,7 +113,7 @@ app.add_middleware(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle validation errors with user-friendly messages.
     """
@@ -63,7 +122,7 @@ async def validation_exception_handler(
         field = " -> ".join(str(loc) for loc in error["loc"])
         errors.append(f"{field}: {error['msg']}")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
@@ -76,7 +135,7 @@ async def validation_exception_handler(
 async def global_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Catch-all exception handler for unhandled errors.
     """
@@ -88,12 +147,27 @@ async def global_exception_handler(
     else:
         detail = "An internal error occurred. Please try again later."
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": detail}
     )
 
 
+# The health and root bodies depend only on settings, and load balancers
+# poll them constantly, so they are rendered once instead of per request
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "app_name": settings.APP_NAME,
+    "version": settings.APP_VERSION
+})
+_ROOT_BODY = orjson.dumps({
+    "message": f"Welcome to {settings.APP_NAME}",
+    "version": settings.APP_VERSION,
+    "docs": "/docs",
+    "health": "/health"
+})
+
+
 # Health check endpoint
 @app.get(
     "/health",
@@ -101,17 +175,14 @@ async def global_exception_handler(
     summary="Health check",
     description="Check if the API is running and healthy."
 )
-async def health_check():
+@limiter.exempt  # Polled by load balancers, not clients
+async def health_check() -> Response:
     """
     Health check endpoint.
 
     Returns the application status and version.
     """
-    return {
-        "status": "healthy",
-        "app_name": settings.APP_NAME,
-        "version": settings.APP_VERSION
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Include API routers
@@ -120,37 +191,13 @@ app.include_router(parent.router, prefix="/api")
 app.include_router(kid.router, prefix="/api")
 
 
-# Startup and shutdown events
-@app.on_event("startup")
-async def startup_event():
-    """
-    Actions to perform on application startup.
-    """
-    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
-    logger.info("Application startup complete")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Actions to perform on application shutdown.
-    """
-    logger.info("Application shutting down...")
-
-
 # Root endpoint
 @app.get("/", tags=["root"])
-async def root():
+async def root() -> Response:
     """
     Root endpoint with API information.
     """
-    return {
-        "message": f"Welcome to {settings.APP_NAME}",
-        "version": settings.APP_VERSION,
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
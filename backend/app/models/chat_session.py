@@ -3,9 +3,8 @@ Chat session database model.
 
 Represents a conversation session between a child and the AI.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, String, Integer, Index
+from sqlalchemy import Column, DateTime, ForeignKey, String, Integer, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -16,31 +15,45 @@ class ChatSession(Base):
 
     __tablename__ = "chat_sessions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7())
     child_id = Column(
         UUID(as_uuid=True),
         ForeignKey("children.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     title = Column(String(255), nullable=True, default="New Chat")
     started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     ended_at = Column(DateTime, nullable=True)
-    last_message_at = Column(DateTime, nullable=True)
+    # Stamped by the database on insert (in UTC, like the naive utcnow()
+    # timestamps elsewhere), then maintained by an AFTER INSERT trigger on
+    # the message table (revision 013)
+    last_message_at = Column(DateTime, server_default=text("timezone('utc', now())"), nullable=True)
     message_count = Column(Integer, default=0, nullable=False)
+    # Set once from the first allowed user message so session lists don't
+    # have to look it up (no FK: messages already reference this table)
+    preview = Column(String(100), nullable=True)
+    first_user_message_id = Column(UUID(as_uuid=True), nullable=True)
 
     # Relationships
-    child = relationship("Child", back_populates="chat_sessions")
+    child = relationship("Child", back_populates="chat_sessions", lazy="raise")
     messages = relationship(
         "Message",
         back_populates="session",
         cascade="all, delete-orphan",
-        order_by="Message.created_at"
+        passive_deletes=True,  # messages.session_id is ON DELETE CASCADE
+        order_by="Message.created_at",
+        lazy="raise"  # Load explicitly with selectinload where needed
     )
 
-    # Composite index for efficient queries
+    # Composite index for efficient queries, plus a partial index for the
+    # "current open session" lookup that only ever matches ended_at IS NULL
     __table_args__ = (
         Index('ix_chat_sessions_child_last_message', 'child_id', 'last_message_at'),
+        Index(
+            'ix_chat_sessions_child_open',
+            child_id,
+            postgresql_where=(ended_at.is_(None))
+        ),
     )
 
     def __repr__(self) -> str:
@@ -3,9 +3,8 @@ Child database model.
 
 Represents a child user who can chat with the AI within parent-defined rules.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -16,7 +15,7 @@ class Child(Base):
 
     __tablename__ = "children"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7())
     parent_id = Column(
         UUID(as_uuid=True),
         ForeignKey("parents.id", ondelete="CASCADE"),
@@ -35,11 +34,13 @@ class Child(Base):
     )
 
     # Relationships
-    parent = relationship("Parent", back_populates="children")
+    parent = relationship("Parent", back_populates="children", lazy="raise")
     chat_sessions = relationship(
         "ChatSession",
         back_populates="child",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,  # chat_sessions.child_id is ON DELETE CASCADE
+        lazy="raise"
     )
 
     def __repr__(self) -> str:
@@ -1,7 +1,7 @@
 """
 Child topic summary model for aggregated topic insights.
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, func, UniqueConstraint
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, func, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -11,7 +11,7 @@ class ChildTopicSummary(Base):
     """Aggregated topic insights for a child."""
     __tablename__ = "child_topic_summary"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7())
     child_id = Column(UUID(as_uuid=True), ForeignKey("children.id", ondelete="CASCADE"), nullable=False)
     topic = Column(String(100), nullable=False)
     total_time_seconds = Column(Integer, nullable=False, default=0)
@@ -19,9 +19,15 @@ class ChildTopicSummary(Base):
     last_accessed = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    # Unique constraint
+    # Unique constraint, plus a covering index for "top topics for this child"
     __table_args__ = (
         UniqueConstraint('child_id', 'topic', name='uix_child_topic'),
+        Index(
+            'ix_child_topic_summary_child_total_time_covering',
+            child_id,
+            total_time_seconds.desc(),
+            postgresql_include=['topic', 'message_count', 'last_accessed']
+        ),
     )
 
     # Relationship
@@ -11,14 +11,14 @@ class ChildWeeklyInsights(Base):
     """Weekly insights summary for a child."""
     __tablename__ = "child_weekly_insights"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7())
     child_id = Column(UUID(as_uuid=True), ForeignKey("children.id", ondelete="CASCADE"), nullable=False)
     week_start = Column(Date, nullable=False)  # Start of the week (Monday)
-    top_topics = Column(JSONB, nullable=False, default=[])  # List of {topic, time_seconds}
+    top_topics = Column(JSONB, nullable=False, default=list)  # List of {topic, time_seconds}
     total_learning_questions = Column(Integer, nullable=False, default=0)
     total_questions = Column(Integer, nullable=False, default=0)
-    new_curiosities = Column(JSONB, nullable=False, default=[])  # Topics accessed for first time
-    needs_support_topics = Column(JSONB, nullable=False, default=[])  # Topics with repeated questions
+    new_curiosities = Column(JSONB, nullable=False, default=list)  # Topics accessed for first time
+    needs_support_topics = Column(JSONB, nullable=False, default=list)  # Topics with repeated questions
     suggested_discussion_topic = Column(String(255), nullable=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
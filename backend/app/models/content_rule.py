@@ -3,10 +3,9 @@ Content rule database model.
 
 Stores content filtering rules (allowlist or blocklist) for each parent.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, Enum as SQLEnum, func
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -23,7 +22,7 @@ class ContentRule(Base):
 
     __tablename__ = "content_rules"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7())
     parent_id = Column(
         UUID(as_uuid=True),
         ForeignKey("parents.id", ondelete="CASCADE"),
@@ -31,13 +30,21 @@ class ContentRule(Base):
         nullable=False
     )
     mode = Column(
-        SQLEnum(ContentRuleMode, values_callable=lambda x: [e.value for e in x]),
+        # Stored as VARCHAR + CHECK rather than a native enum type
+        SQLEnum(
+            ContentRuleMode,
+            values_callable=lambda x: [e.value for e in x],
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+            name="content_rules_mode_check"
+        ),
         nullable=False,
         default=ContentRuleMode.BLOCKLIST
     )
-    # JSON arrays for flexible topic/keyword storage
-    topics = Column(JSONB, nullable=False, default=list)
-    keywords = Column(JSONB, nullable=False, default=list)
+    # Native text arrays (GIN-indexed) for topic/keyword storage
+    topics = Column(ARRAY(Text), nullable=False, default=list)
+    keywords = Column(ARRAY(Text), nullable=False, default=list)
     updated_at = Column(
         DateTime,
         default=datetime.utcnow,
@@ -48,5 +55,10 @@ class ContentRule(Base):
     # Relationships
     parent = relationship("Parent", back_populates="content_rules")
 
+    __table_args__ = (
+        Index('ix_content_rules_topics_gin', topics, postgresql_using='gin'),
+        Index('ix_content_rules_keywords_gin', keywords, postgresql_using='gin'),
+    )
+
     def __repr__(self) -> str:
         return f"<ContentRule(id={self.id}, parent_id={self.parent_id}, mode={self.mode})>"
@@ -3,9 +3,8 @@ Message database model.
 
 Stores individual chat messages with metadata about blocking status.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Index, Enum as SQLEnum, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -23,21 +22,48 @@ class Message(Base):
 
     __tablename__ = "messages"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7())
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey("chat_sessions.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
+    )
+    # Stored as VARCHAR + CHECK rather than a native enum type
+    role = Column(
+        SQLEnum(
+            MessageRole,
+            values_callable=lambda x: [e.value for e in x],
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+            name="messages_role_check"
+        ),
+        nullable=False
     )
-    role = Column(SQLEnum(MessageRole, values_callable=lambda x: [e.value for e in x]), nullable=False)
     content = Column(Text, nullable=False)
     blocked = Column(Boolean, default=False, nullable=False)
     block_reason = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
-    session = relationship("ChatSession", back_populates="messages")
+    session = relationship("ChatSession", back_populates="messages", lazy="raise")
+
+    # Covering index for latest-messages-in-session reads
+    __table_args__ = (
+        Index(
+            'ix_messages_session_created',
+            session_id,
+            created_at.desc(),
+            postgresql_include=['role', 'blocked']
+        ),
+        # Partial index for the common unblocked-only reads
+        Index(
+            'ix_messages_session_created_unblocked',
+            session_id,
+            created_at.desc(),
+            postgresql_where=(blocked == False)
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, role={self.role}, blocked={self.blocked})>"
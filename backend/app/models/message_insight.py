@@ -1,7 +1,7 @@
 """
 Message insight model for tracking per-message analytics.
 """
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, ForeignKey, func
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -11,7 +11,7 @@ class MessageInsight(Base):
     """Track analytics for individual messages."""
     __tablename__ = "message_insights"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7())
     message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id", ondelete="CASCADE"), nullable=False, unique=True)
     topic = Column(String(100), nullable=True)
     is_learning_question = Column(Boolean, nullable=False, default=False)
@@ -20,3 +20,13 @@ class MessageInsight(Base):
 
     # Relationship
     message = relationship("Message", backref="insight", uselist=False)
+
+    # Covering index for per-topic dashboard aggregations
+    __table_args__ = (
+        Index(
+            'ix_message_insights_topic_created',
+            topic,
+            created_at.desc(),
+            postgresql_include=['is_learning_question', 'estimated_time_seconds']
+        ),
+    )
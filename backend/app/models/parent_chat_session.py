@@ -3,9 +3,8 @@ Parent chat session database model.
 
 Represents a conversation session between a parent and the AI.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, String, Integer, Index
+from sqlalchemy import Column, DateTime, ForeignKey, String, Integer, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -16,31 +15,36 @@ class ParentChatSession(Base):
 
     __tablename__ = "parent_chat_sessions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7())
     parent_id = Column(
         UUID(as_uuid=True),
         ForeignKey("parents.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     title = Column(String(255), nullable=True, default="New Chat")
     started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     ended_at = Column(DateTime, nullable=True)
-    last_message_at = Column(DateTime, nullable=True)
+    # Stamped by the database on insert (in UTC, like the naive utcnow()
+    # timestamps elsewhere), then maintained by an AFTER INSERT trigger on
+    # the message table (revision 013)
+    last_message_at = Column(DateTime, server_default=text("timezone('utc', now())"), nullable=False)
     message_count = Column(Integer, default=0, nullable=False)
 
-    # Relationships
-    parent = relationship("Parent", back_populates="chat_sessions")
+    # Relationships. Handlers select the columns they need, so an implicit
+    # lazy load is always a bug; raise instead of emitting a hidden query.
+    parent = relationship("Parent", back_populates="chat_sessions", lazy="raise")
     messages = relationship(
         "ParentMessage",
         back_populates="session",
         cascade="all, delete-orphan",
-        order_by="ParentMessage.created_at"
+        passive_deletes=True,  # parent_messages.session_id is ON DELETE CASCADE
+        order_by="ParentMessage.created_at",
+        lazy="raise"
     )
 
-    # Composite index for efficient queries
+    # Composite index for listing and keyset-paginating a parent's sessions
     __table_args__ = (
-        Index('ix_parent_chat_sessions_parent_last_message', 'parent_id', 'last_message_at'),
+        Index('ix_parent_chat_sessions_parent_last_message_id', 'parent_id', 'last_message_at', 'id'),
     )
 
     def __repr__(self) -> str:
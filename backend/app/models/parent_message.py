@@ -3,9 +3,8 @@ Parent message database model.
 
 Stores individual chat messages for parent conversations.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Index, Enum as SQLEnum, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -17,19 +16,41 @@ class ParentMessage(Base):
 
     __tablename__ = "parent_messages"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuidv7())
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey("parent_chat_sessions.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
+    )
+    # Stored as VARCHAR + CHECK rather than a native enum type
+    role = Column(
+        SQLEnum(
+            MessageRole,
+            values_callable=lambda x: [e.value for e in x],
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+            name="parent_messages_role_check"
+        ),
+        nullable=False
     )
-    role = Column(SQLEnum(MessageRole, values_callable=lambda x: [e.value for e in x]), nullable=False)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
-    session = relationship("ParentChatSession", back_populates="messages")
+    session = relationship("ParentChatSession", back_populates="messages", lazy="raise")
+
+    # Covering index for latest-messages-in-session reads
+    __table_args__ = (
+        Index(
+            'ix_parent_messages_session_created',
+            session_id,
+            created_at.desc(),
+            postgresql_include=['role']
+        ),
+        # First-user-message lookups for session previews
+        Index('ix_parent_messages_session_role_created', session_id, role, created_at),
+    )
 
     def __repr__(self) -> str:
         return f"<ParentMessage(id={self.id}, role={self.role})>"
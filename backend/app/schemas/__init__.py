@@ -34,6 +34,7 @@ from app.schemas.message import (
     ChatResponse,
     ChatSessionResponse,
     ChatHistoryResponse,
+    ChatHistoryPage,
 )
 
 __all__ = [
@@ -64,4 +65,5 @@ __all__ = [
     "ChatResponse",
     "ChatSessionResponse",
     "ChatHistoryResponse",
+    "ChatHistoryPage",
 ]
@@ -1,7 +1,7 @@
 """
 Child-related schemas for request/response validation.
 """
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from datetime import datetime
 from uuid import UUID
 from typing import Optional
@@ -31,9 +31,7 @@ class ChildResponse(ChildBase):
     created_at: datetime = Field(..., alias="createdAt")
     updated_at: datetime = Field(..., alias="updatedAt")
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class ChildProfile(BaseModel):
@@ -42,5 +40,4 @@ class ChildProfile(BaseModel):
     email: str
     name: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
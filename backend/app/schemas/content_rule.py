@@ -1,7 +1,7 @@
 """
 Content rule schemas for request/response validation.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from uuid import UUID
 from typing import List
@@ -33,5 +33,4 @@ class ContentRuleResponse(ContentRuleBase):
     parent_id: UUID
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
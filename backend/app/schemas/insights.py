@@ -1,7 +1,7 @@
 """
 Schemas for parent insights dashboard.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime, date
 from uuid import UUID
 from typing import Optional, List
@@ -51,9 +51,9 @@ class ChildInsightsDashboard(BaseModel):
     total_sessions: int = Field(..., description="Total number of chat sessions")
     total_engagement_minutes: int = Field(..., description="Total estimated engagement time in minutes")
     last_activity: Optional[datetime] = Field(None, description="When the child was last active")
+    generated_at: datetime = Field(default_factory=datetime.utcnow, description="When these insights were computed")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TopicSummaryResponse(BaseModel):
@@ -63,8 +63,7 @@ class TopicSummaryResponse(BaseModel):
     message_count: int
     last_accessed: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InsightsSummary(BaseModel):
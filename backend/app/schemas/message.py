@@ -1,7 +1,7 @@
 """
 Message and chat session schemas for request/response validation.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from uuid import UUID
 from typing import List, Optional
@@ -15,17 +15,19 @@ class ChatMessageRequest(BaseModel):
 
 
 class MessageResponse(BaseModel):
-    """Schema for a single message response."""
+    """
+    Schema for a single message response.
+
+    Only the fields the chat UI renders are exposed, so history endpoints
+    can build it straight from column rows instead of full ORM objects.
+    """
     id: UUID
-    session_id: UUID
     role: MessageRole
     content: str
     blocked: bool
-    block_reason: Optional[str]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class YouTubeVideoSuggestion(BaseModel):
@@ -57,8 +59,7 @@ class ChatSessionSummary(BaseModel):
     message_count: int
     preview: Optional[str] = Field(None, description="First ~100 chars of first user message")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaginatedChatSessions(BaseModel):
@@ -81,8 +82,7 @@ class FullChatSession(BaseModel):
     last_message_at: Optional[datetime] = None
     message_count: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CreateChatSessionRequest(BaseModel):
@@ -98,8 +98,7 @@ class CreateChatSessionResponse(BaseModel):
     started_at: datetime
     messages: List[MessageResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatSessionResponse(BaseModel):
@@ -110,8 +109,7 @@ class ChatSessionResponse(BaseModel):
     ended_at: Optional[datetime]
     messages: List[MessageResponse]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatHistoryResponse(BaseModel):
@@ -119,3 +117,9 @@ class ChatHistoryResponse(BaseModel):
     sessions: List[ChatSessionResponse]
     total_sessions: int
     total_messages: int
+
+
+class ChatHistoryPage(BaseModel):
+    """Schema for one keyset-paginated page of chat history."""
+    sessions: List[ChatSessionResponse]
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to fetch the next page; null on the last page")
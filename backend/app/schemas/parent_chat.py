@@ -1,7 +1,7 @@
 """
 Parent chat session and message schemas for request/response validation.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from uuid import UUID
 from typing import List, Optional
@@ -22,8 +22,7 @@ class ParentMessageResponse(BaseModel):
     content: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ParentChatResponse(BaseModel):
@@ -43,17 +42,17 @@ class ParentChatSessionSummary(BaseModel):
     message_count: int
     preview: Optional[str] = Field(None, description="First ~100 chars of first user message")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaginatedParentChatSessions(BaseModel):
     """Schema for paginated parent chat sessions response."""
     sessions: List[ParentChatSessionSummary]
-    total: int = Field(..., description="Total number of sessions")
-    page: int
+    total: Optional[int] = Field(None, description="Total number of sessions; null when include_total is false")
+    page: Optional[int] = Field(None, description="Page number; null when paging by cursor")
     page_size: int
     has_more: bool = Field(..., description="True if more pages exist")
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to fetch the next page; null on the last page")
 
 
 class FullParentChatSession(BaseModel):
@@ -67,8 +66,7 @@ class FullParentChatSession(BaseModel):
     last_message_at: Optional[datetime] = None
     message_count: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CreateParentChatSessionResponse(BaseModel):
@@ -79,5 +77,4 @@ class CreateParentChatSessionResponse(BaseModel):
     started_at: datetime
     messages: List[ParentMessageResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -4,10 +4,12 @@ AI integration service for communicating with external AI providers.
 This service is designed to be provider-agnostic and can be easily
 extended to support different AI providers.
 """
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, AsyncIterator
 from abc import ABC, abstractmethod
-from openai import OpenAI, APIError, RateLimitError, APIConnectionError
+import httpx
+from openai import AsyncOpenAI, APIError, RateLimitError, APIConnectionError
 import google.generativeai as genai
 from app.config import get_settings
 from app.core.exceptions import AIServiceError
@@ -15,6 +17,11 @@ from app.core.exceptions import AIServiceError
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Outbound AI calls share one pooled HTTP client per provider; replies take
+# seconds, so many requests are in flight at once on the event loop
+AI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+AI_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
 
 # System prompt for kid-friendly responses
 KID_FRIENDLY_SYSTEM_PROMPT = """You are a helpful, friendly AI assistant designed for children.
@@ -38,7 +45,7 @@ class AIProvider(ABC):
     """Abstract base class for AI providers."""
 
     @abstractmethod
-    def generate_response(
+    async def generate_response(
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
@@ -60,7 +67,7 @@ class AIProvider(ABC):
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
-    ) -> Iterator[str]:
+    ) -> AsyncIterator[str]:
         """
         Generate a streaming response from the AI.
 
@@ -73,6 +80,9 @@ class AIProvider(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Release any network resources held by the provider."""
+
 
 class OpenAIProvider(AIProvider):
     """OpenAI API provider implementation."""
@@ -81,10 +91,17 @@ class OpenAIProvider(AIProvider):
         """Initialize OpenAI client."""
         if not settings.OPENAI_API_KEY:
             logger.warning("OpenAI API key not configured")
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(limits=AI_HTTP_LIMITS, timeout=AI_HTTP_TIMEOUT)
+        )
         self.model = "gpt-3.5-turbo"  # Can be configured via settings
 
-    def generate_response(
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self.client.close()
+
+    async def generate_response(
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
@@ -119,7 +136,7 @@ class OpenAIProvider(AIProvider):
             messages.append({"role": "user", "content": message})
 
             # Make API call
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 max_tokens=500,  # Reasonable limit for kid responses
@@ -147,11 +164,11 @@ class OpenAIProvider(AIProvider):
             logger.error(f"Unexpected error in AI service: {e}")
             raise AIServiceError("An unexpected error occurred. Please try again.")
 
-    def generate_response_stream(
+    async def generate_response_stream(
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
-    ) -> Iterator[str]:
+    ) -> AsyncIterator[str]:
         """
         Generate a streaming response using OpenAI API.
 
@@ -182,7 +199,7 @@ class OpenAIProvider(AIProvider):
             messages.append({"role": "user", "content": message})
 
             # Make streaming API call
-            stream = self.client.chat.completions.create(
+            stream = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 max_tokens=500,  # Reasonable limit for kid responses
@@ -193,7 +210,7 @@ class OpenAIProvider(AIProvider):
             )
 
             # Yield response chunks
-            for chunk in stream:
+            async for chunk in stream:
                 if chunk.choices[0].delta.content is not None:
                     yield chunk.choices[0].delta.content
 
@@ -229,7 +246,7 @@ class GeminiProvider(AIProvider):
         self.model_name = "gemini-2.5-flash-lite"
         self.model = genai.GenerativeModel(self.model_name)
 
-    def generate_response(
+    async def generate_response(
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
@@ -263,7 +280,7 @@ class GeminiProvider(AIProvider):
             contents += "User: " + message + "\n\nAssistant: "
 
             # Generate response
-            response = self.model.generate_content(
+            response = await self.model.generate_content_async(
                 contents,
                 generation_config={
                     "max_output_tokens": 500,
@@ -288,11 +305,11 @@ class GeminiProvider(AIProvider):
                 logger.error(f"Unexpected error in Gemini service: {e}")
                 raise AIServiceError("An unexpected error occurred. Please try again.")
 
-    def generate_response_stream(
+    async def generate_response_stream(
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
-    ) -> Iterator[str]:
+    ) -> AsyncIterator[str]:
         """
         Generate a streaming response using Google Gemini API.
 
@@ -322,7 +339,7 @@ class GeminiProvider(AIProvider):
             contents += "User: " + message + "\n\nAssistant: "
 
             # Generate streaming response
-            response = self.model.generate_content(
+            response = await self.model.generate_content_async(
                 contents,
                 generation_config={
                     "max_output_tokens": 500,
@@ -332,7 +349,7 @@ class GeminiProvider(AIProvider):
             )
 
             # Yield response chunks - properly handle the streaming iterator
-            for chunk in response:
+            async for chunk in response:
                 # Access the text from the chunk's parts
                 if hasattr(chunk, 'text') and chunk.text:
                     yield chunk.text
@@ -360,7 +377,7 @@ class GeminiProvider(AIProvider):
 class MockAIProvider(AIProvider):
     """Mock AI provider for testing without API calls."""
 
-    def generate_response(
+    async def generate_response(
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
@@ -375,11 +392,11 @@ class MockAIProvider(AIProvider):
         """
         return f"Thank you for your question about: '{message[:50]}...'. I'm here to help you learn and explore safely!"
 
-    def generate_response_stream(
+    async def generate_response_stream(
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
-    ) -> Iterator[str]:
+    ) -> AsyncIterator[str]:
         """
         Generate a mock streaming response.
         Args:
@@ -388,13 +405,12 @@ class MockAIProvider(AIProvider):
         Yields:
             Chunks of mock response text
         """
-        import time
         response = f"Thank you for your question about: '{message[:50]}...'. I'm here to help you learn and explore safely!"
         # Simulate streaming by yielding words one at a time
         words = response.split()
         for word in words:
             yield word + " "
-            time.sleep(0.05)  # Small delay to simulate streaming
+            await asyncio.sleep(0.05)  # Small delay to simulate streaming
 
 
 class AIService:
@@ -458,7 +474,7 @@ class AIService:
                 logger.warning("No API keys configured, using mock provider")
                 return MockAIProvider()
 
-    def get_response(
+    async def get_response(
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
@@ -476,13 +492,13 @@ class AIService:
         Raises:
             AIServiceError: If response generation fails
         """
-        return self.provider.generate_response(message, conversation_history)
+        return await self.provider.generate_response(message, conversation_history)
 
     def get_response_stream(
         self,
         message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None
-    ) -> Iterator[str]:
+    ) -> AsyncIterator[str]:
         """
         Get streaming AI response for a message.
 
@@ -498,13 +514,17 @@ class AIService:
         """
         return self.provider.generate_response_stream(message, conversation_history)
 
+    async def aclose(self) -> None:
+        """Release the provider's pooled connections on shutdown."""
+        await self.provider.aclose()
+
     @staticmethod
     def format_history_from_messages(messages: List[Any]) -> List[Dict[str, str]]:
         """
         Format database message objects into conversation history format.
 
         Args:
-            messages: List of Message model objects
+            messages: Message objects or rows with role, content and blocked
 
         Returns:
             List of dictionaries with role and content
@@ -518,7 +538,7 @@ class AIService:
                 })
         return history
 
-    def generate_session_title(self, user_messages: List[str]) -> str:
+    async def generate_session_title(self, user_messages: List[str]) -> str:
         """
         Generate a concise title for a chat session based on user messages.
 
@@ -557,7 +577,7 @@ Respond with ONLY the title, nothing else."""
 
             # For real providers, we need to use direct API calls without the system prompt
             if isinstance(self.provider, OpenAIProvider):
-                response = self.provider.client.chat.completions.create(
+                response = await self.provider.client.chat.completions.create(
                     model=self.provider.model,
                     messages=[{"role": "user", "content": title_prompt}],
                     max_tokens=20,
@@ -565,11 +585,9 @@ Respond with ONLY the title, nothing else."""
                 )
                 title = response.choices[0].message.content.strip()
             elif isinstance(self.provider, GeminiProvider):
-                # Use the new client API for title generation
-                response = self.provider.client.models.generate_content(
-                    model="gemini-2.5-flash-lite",
-                    contents=[title_prompt],
-                    config={
+                response = await self.provider.model.generate_content_async(
+                    title_prompt,
+                    generation_config={
                         "max_output_tokens": 20,
                         "temperature": 0.5,
                     }
@@ -638,7 +656,7 @@ Respond with ONLY the title, nothing else."""
 ai_service = AIService()
 
 
-def get_ai_response(
+async def get_ai_response(
     message: str,
     conversation_history: Optional[List[Dict[str, str]]] = None
 ) -> str:
@@ -652,13 +670,13 @@ def get_ai_response(
     Returns:
         AI's response text
     """
-    return ai_service.get_response(message, conversation_history)
+    return await ai_service.get_response(message, conversation_history)
 
 
 def get_ai_response_stream(
     message: str,
     conversation_history: Optional[List[Dict[str, str]]] = None
-) -> Iterator[str]:
+) -> AsyncIterator[str]:
     """
     Convenience function to get streaming AI response.
 
@@ -672,7 +690,7 @@ def get_ai_response_stream(
     return ai_service.get_response_stream(message, conversation_history)
 
 
-def generate_session_title(user_messages: List[str]) -> str:
+async def generate_session_title(user_messages: List[str]) -> str:
     """
     Convenience function to generate a session title.
 
@@ -682,4 +700,4 @@ def generate_session_title(user_messages: List[str]) -> str:
     Returns:
         Generated title string
     """
-    return ai_service.generate_session_title(user_messages)
+    return await ai_service.generate_session_title(user_messages)
@@ -3,7 +3,9 @@ Authentication service for user registration and login.
 """
 from typing import Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Parent, Child, ContentRule, ContentRuleMode
 from app.schemas import ParentRegister, Token
 from app.core.security import (
@@ -21,7 +23,7 @@ class AuthService:
     """Service for authentication operations."""
 
     @staticmethod
-    def register_parent(db: Session, data: ParentRegister) -> Parent:
+    async def register_parent(db: AsyncSession, data: ParentRegister) -> Parent:
         """
         Register a new parent account.
 
@@ -36,20 +38,21 @@ class AuthService:
             ConflictError: If email already exists
         """
         # Check if email already exists
-        existing_parent = db.query(Parent).filter(
-            Parent.email == data.email
-        ).first()
+        existing_parent = (await db.execute(
+            select(Parent).where(Parent.email == data.email)
+        )).scalars().first()
         if existing_parent:
             raise ConflictError("Email already registered")
 
         # Create new parent with hashed password
         new_parent = Parent(
             email=data.email,
-            password_hash=hash_password(data.password),
+            # bcrypt is CPU-bound; keep it off the event loop
+            password_hash=await run_in_threadpool(hash_password, data.password),
             name=data.name
         )
         db.add(new_parent)
-        db.flush()
+        await db.flush()
 
         # Create default content rules (blocklist mode with common restrictions)
         default_rules = ContentRule(
@@ -60,14 +63,13 @@ class AuthService:
         )
         db.add(default_rules)
 
-        db.commit()
-        db.refresh(new_parent)
+        await db.commit()
 
         return new_parent
 
     @staticmethod
-    def authenticate_parent(
-        db: Session,
+    async def authenticate_parent(
+        db: AsyncSession,
         email: str,
         password: str
     ) -> Parent:
@@ -85,19 +87,21 @@ class AuthService:
         Raises:
             AuthenticationError: If credentials are invalid
         """
-        parent = db.query(Parent).filter(Parent.email == email).first()
+        parent = (await db.execute(
+            select(Parent).where(Parent.email == email)
+        )).scalars().first()
 
         if not parent:
             raise AuthenticationError("Invalid email or password")
 
-        if not verify_password(password, parent.password_hash):
+        if not await run_in_threadpool(verify_password, password, parent.password_hash):
             raise AuthenticationError("Invalid email or password")
 
         return parent
 
     @staticmethod
-    def authenticate_kid(
-        db: Session,
+    async def authenticate_kid(
+        db: AsyncSession,
         email: str,
         password: str
     ) -> Child:
@@ -115,12 +119,14 @@ class AuthService:
         Raises:
             AuthenticationError: If credentials are invalid
         """
-        child = db.query(Child).filter(Child.email == email).first()
+        child = (await db.execute(
+            select(Child).where(Child.email == email)
+        )).scalars().first()
 
         if not child:
             raise AuthenticationError("Invalid email or password")
 
-        if not verify_password(password, child.password_hash):
+        if not await run_in_threadpool(verify_password, password, child.password_hash):
             raise AuthenticationError("Invalid email or password")
 
         return child
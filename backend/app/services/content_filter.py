@@ -5,9 +5,101 @@ This service is responsible for ensuring kid messages comply with
 parent-defined content rules before being sent to the AI.
 """
 import re
+from functools import lru_cache
 from typing import Tuple, Optional, List
 from app.models import ContentRule, ContentRuleMode
 
+# Compiled matchers kept per distinct rule set; parents rarely edit rules,
+# so this comfortably holds every active set in a worker
+MATCHER_CACHE_SIZE = 1024
+
+
+def _trie_regex(node: dict) -> str:
+    """
+    Render a term trie as a regex with shared prefixes factored out.
+
+    Args:
+        node: Trie node mapping next character to child node; the ""
+            key marks the end of a term
+
+    Returns:
+        Regex source matching any term below this node
+    """
+    if "" in node:
+        # Only existence matters, so a term ending here makes every longer
+        # term through this node redundant
+        return ""
+    branches = [re.escape(char) + _trie_regex(child) for char, child in sorted(node.items())]
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+class _TermMatcher:
+    """Precompiled substring matcher for one rule set's terms."""
+
+    __slots__ = ("pattern", "first_chars", "min_length")
+
+    def __init__(self, pattern: re.Pattern, first_chars: Optional[frozenset], min_length: int):
+        self.pattern = pattern
+        # None when an empty term matches everything and nothing can be skipped
+        self.first_chars = first_chars
+        self.min_length = min_length
+
+    def matches(self, text: str) -> bool:
+        """
+        Check whether any term occurs in text.
+
+        Cheap rejections run first: a message shorter than every term, or
+        one containing none of the characters a term starts with, cannot
+        match, so the regex scan is skipped.
+
+        Args:
+            text: Lowercased text to search
+
+        Returns:
+            True if at least one term is found
+        """
+        if self.first_chars is not None:
+            if len(text) < self.min_length or self.first_chars.isdisjoint(text):
+                return False
+        return self.pattern.search(text) is not None
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _compile_terms(terms: Tuple[str, ...]) -> _TermMatcher:
+    """
+    Compile a rule set's terms into one matcher for lowercased text.
+
+    The terms are merged into a trie first, so at each position of the
+    message the regex engine follows a single branch per character
+    (Aho-Corasick style) instead of retrying every term in turn.
+
+    Cached on the terms themselves, so an edited rule set simply misses
+    and compiles afresh; no explicit invalidation is needed.
+
+    Args:
+        terms: Topics or keywords from a parent's content rules
+
+    Returns:
+        Matcher reporting whether any of the terms occurs as a substring
+    """
+    lowered = [term.lower() for term in terms]
+    trie: dict = {}
+    for term in lowered:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    if all(lowered):
+        first_chars = frozenset(term[0] for term in lowered)
+        min_length = min(len(term) for term in lowered)
+    else:
+        first_chars, min_length = None, 0
+
+    return _TermMatcher(re.compile(_trie_regex(trie)), first_chars, min_length)
+
 
 class ContentFilter:
     """
@@ -62,14 +154,11 @@ class ContentFilter:
             # If no topics defined in allowlist, block everything
             return (False, "No approved topics configured. Contact your parent.")
 
-        message_lower = message.lower()
-
-        # Check if message contains any approved topic
-        for topic in content_rules.topics:
-            topic_lower = topic.lower()
-            # Use word boundary matching for better accuracy
-            if ContentFilter._contains_word(message_lower, topic_lower):
-                return (True, None)
+        # Check if message contains any approved topic (one precompiled
+        # scan over all topics)
+        matcher = _compile_terms(tuple(content_rules.topics))
+        if matcher.matches(message.lower()):
+            return (True, None)
 
         # No approved topic found in message
         return (
@@ -99,17 +188,10 @@ class ContentFilter:
             # If no keywords defined in blocklist, allow everything
             return (True, None)
 
-        message_lower = message.lower()
-
-        # Check if message contains any blocked keyword
-        blocked_keywords_found = []
-        for keyword in content_rules.keywords:
-            keyword_lower = keyword.lower()
-            # Use substring matching for blocklist (more restrictive)
-            if ContentFilter._contains_keyword(message_lower, keyword_lower):
-                blocked_keywords_found.append(keyword)
-
-        if blocked_keywords_found:
+        # Check if message contains any blocked keyword (substring matching,
+        # one precompiled scan over all keywords)
+        matcher = _compile_terms(tuple(content_rules.keywords))
+        if matcher.matches(message.lower()):
             return (
                 False,
                 "Message contains restricted content. Please rephrase your question."
@@ -117,42 +199,6 @@ class ContentFilter:
 
         return (True, None)
 
-    @staticmethod
-    def _contains_word(text: str, word: str) -> bool:
-        """
-        Check if text contains word (with word boundary matching).
-
-        Uses regex word boundaries for more accurate topic matching.
-
-        Args:
-            text: Text to search in (lowercase)
-            word: Word to search for (lowercase)
-
-        Returns:
-            True if word found in text
-        """
-        # Escape special regex characters in the word
-        escaped_word = re.escape(word)
-        # Match as whole word or part of compound word
-        pattern = rf'\b{escaped_word}\b|{escaped_word}'
-        return bool(re.search(pattern, text))
-
-    @staticmethod
-    def _contains_keyword(text: str, keyword: str) -> bool:
-        """
-        Check if text contains keyword (substring matching).
-
-        Uses substring matching for blocklist to be more restrictive.
-
-        Args:
-            text: Text to search in (lowercase)
-            keyword: Keyword to search for (lowercase)
-
-        Returns:
-            True if keyword found in text
-        """
-        return keyword in text
-
     @staticmethod
     def sanitize_message(message: str) -> str:
         """
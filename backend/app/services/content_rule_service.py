@@ -0,0 +1,179 @@
+"""
+Content rule lookup with request-scoped and Redis caching.
+
+Content rules change rarely but are read on every kid chat turn, so
+lookups are memoized per request, held briefly in process memory and
+cached across requests and workers in Redis. Database reads that do
+miss are batched: concurrent requests in the same event-loop tick share
+one ``parent_id IN (...)`` query.
+"""
+import asyncio
+import hashlib
+import json
+from datetime import datetime
+from typing import Dict, Optional, Set
+from uuid import UUID
+from cachetools import TTLCache
+from sqlalchemy import select
+from app.core.cache import cache_get, cache_set, cache_delete
+from app.database import AsyncSessionLocal
+from app.models import ContentRule, ContentRuleMode
+
+# Cross-request cache lifetime for a parent's rules
+CONTENT_RULES_TTL_SECONDS = 60
+
+# In-process copies skip the Redis round trip (or the database, when Redis
+# isn't configured). Kept short because invalidation only reaches the
+# worker that handled the update.
+CONTENT_RULES_LOCAL_TTL_SECONDS = 5
+_LOCAL_CACHE: TTLCache = TTLCache(maxsize=10000, ttl=CONTENT_RULES_LOCAL_TTL_SECONDS)
+
+
+def _cache_key(parent_id: UUID) -> str:
+    return f"content_rules:v2:{parent_id}"
+
+
+def _serialize(rules: ContentRule) -> bytes:
+    return json.dumps({
+        "id": str(rules.id),
+        "parent_id": str(rules.parent_id),
+        "mode": rules.mode.value,
+        "topics": list(rules.topics),
+        "keywords": list(rules.keywords),
+        "updated_at": rules.updated_at.isoformat(),
+    }).encode()
+
+
+def _deserialize(raw: bytes) -> ContentRule:
+    data = json.loads(raw)
+    # Detached instance; never added to a session
+    return ContentRule(
+        id=UUID(data["id"]),
+        parent_id=UUID(data["parent_id"]),
+        mode=ContentRuleMode(data["mode"]),
+        topics=data["topics"],
+        keywords=data["keywords"],
+        updated_at=datetime.fromisoformat(data["updated_at"])
+    )
+
+
+def content_rules_etag(rules: ContentRule) -> str:
+    """
+    Build an HTTP entity tag for a parent's rules.
+
+    Args:
+        rules: Content rules as returned by get_content_rules
+
+    Returns:
+        Quoted strong ETag that changes whenever the rules do
+    """
+    return f'"{hashlib.blake2b(_serialize(rules), digest_size=16).hexdigest()}"'
+
+
+class ContentRuleLoader:
+    """
+    Coalesce concurrent content rule reads into batched queries.
+
+    Every load() issued before the event loop gets back to its scheduler
+    joins the same batch, which runs once on its own database session.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[UUID, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, parent_id: UUID) -> Optional[ContentRule]:
+        """
+        Load one parent's rules as part of the current batch.
+
+        Args:
+            parent_id: UUID of the parent who owns the rules
+
+        Returns:
+            Detached ContentRule instance, or None if the parent has no rules
+        """
+        future = self._pending.get(parent_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            self._pending[parent_id] = future
+        # Shielded so one cancelled caller doesn't fail the others waiting
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        task = asyncio.create_task(self._load_batch(batch))
+        # Hold a reference until done so the task isn't garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, batch: Dict[UUID, asyncio.Future]) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(
+                    select(ContentRule).where(ContentRule.parent_id.in_(batch.keys()))
+                )).scalars().all()
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        rules_by_parent = {rules.parent_id: rules for rules in rows}
+        for parent_id, future in batch.items():
+            if not future.done():
+                future.set_result(rules_by_parent.get(parent_id))
+
+
+# Shared by every request in this worker process
+content_rule_loader = ContentRuleLoader()
+
+
+async def get_content_rules(
+    parent_id: UUID,
+    request_cache: Optional[dict] = None
+) -> Optional[ContentRule]:
+    """
+    Get a parent's content rules, for filtering or for the parent's own view.
+
+    Args:
+        parent_id: UUID of the parent who owns the rules
+        request_cache: Per-request memo dict (see get_request_cache)
+
+    Returns:
+        ContentRule instance, or None if the parent has no rules
+    """
+    key = _cache_key(parent_id)
+
+    if request_cache is not None and key in request_cache:
+        return request_cache[key]
+
+    rules = _LOCAL_CACHE.get(key)
+    if rules is None:
+        raw = await cache_get(key)
+        if raw is not None:
+            rules = _deserialize(raw)
+        else:
+            rules = await content_rule_loader.load(parent_id)
+            if rules:
+                await cache_set(key, _serialize(rules), CONTENT_RULES_TTL_SECONDS)
+        if rules:
+            _LOCAL_CACHE[key] = rules
+
+    if request_cache is not None:
+        request_cache[key] = rules
+    return rules
+
+
+async def invalidate_content_rules(parent_id: UUID) -> None:
+    """
+    Drop a parent's cached rules after they change.
+
+    Args:
+        parent_id: UUID of the parent who owns the rules
+    """
+    key = _cache_key(parent_id)
+    _LOCAL_CACHE.pop(key, None)
+    await cache_delete(key)
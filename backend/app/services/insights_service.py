@@ -8,9 +8,12 @@ import re
 from datetime import datetime, timedelta, date
 from typing import Optional, List, Dict, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, desc
+from sqlalchemy import select, func, and_, desc
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.core.cache import cache_get, cache_set, cache_delete
 from app.models import (
     Child,
     ChatSession,
@@ -50,6 +53,15 @@ TOPIC_KEYWORDS = {
     "Language": ["language", "word", "grammar", "vocabulary", "speak", "translate", "sentence"],
 }
 
+# Cross-request cache lifetime for a child's computed dashboard; an
+# explicit refresh drops it sooner
+INSIGHTS_DASHBOARD_TTL_SECONDS = 300
+
+
+def _dashboard_cache_key(child_id: UUID) -> str:
+    return f"insights_dashboard:{child_id}"
+
+
 # Patterns indicating learning questions
 LEARNING_QUESTION_PATTERNS = [
     r'\bwhy\b',
@@ -144,8 +156,8 @@ def estimate_engagement_time(message_content: str, response_content: str) -> int
     return max(30, min(300, total_time))
 
 
-def process_message_for_insights(
-    db: Session,
+async def process_message_for_insights(
+    db: AsyncSession,
     message: Message,
     response: Optional[Message] = None
 ) -> None:
@@ -166,9 +178,9 @@ def process_message_for_insights(
         return
 
     # Skip if already processed
-    existing = db.query(MessageInsight).filter(
-        MessageInsight.message_id == message.id
-    ).first()
+    existing = (await db.execute(
+        select(MessageInsight.id).where(MessageInsight.message_id == message.id)
+    )).first()
     if existing:
         return
 
@@ -191,13 +203,13 @@ def process_message_for_insights(
 
     # Update topic summary if topic was identified
     if topic:
-        update_topic_summary(db, message, topic, engagement_time)
+        await update_topic_summary(db, message, topic, engagement_time)
 
-    db.commit()
+    await db.commit()
 
 
-def update_topic_summary(
-    db: Session,
+async def update_topic_summary(
+    db: AsyncSession,
     message: Message,
     topic: str,
     time_seconds: int
@@ -212,34 +224,32 @@ def update_topic_summary(
         time_seconds: Engagement time in seconds
     """
     # Get child_id from session
-    session = db.query(ChatSession).filter(
-        ChatSession.id == message.session_id
-    ).first()
+    session = await db.get(ChatSession, message.session_id)
 
     if not session:
         return
 
     child_id = session.child_id
 
-    # Find or create topic summary
-    summary = db.query(ChildTopicSummary).filter(
-        ChildTopicSummary.child_id == child_id,
-        ChildTopicSummary.topic == topic
-    ).first()
-
-    if summary:
-        summary.total_time_seconds += time_seconds
-        summary.message_count += 1
-        summary.last_accessed = datetime.utcnow()
-    else:
-        summary = ChildTopicSummary(
-            child_id=child_id,
-            topic=topic,
-            total_time_seconds=time_seconds,
-            message_count=1,
-            last_accessed=datetime.utcnow()
-        )
-        db.add(summary)
+    # Upsert the topic summary in one statement (keyed by uix_child_topic)
+    now = datetime.utcnow()
+    stmt = insert(ChildTopicSummary).values(
+        child_id=child_id,
+        topic=topic,
+        total_time_seconds=time_seconds,
+        message_count=1,
+        last_accessed=now
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ChildTopicSummary.child_id, ChildTopicSummary.topic],
+        set_={
+            "total_time_seconds": ChildTopicSummary.total_time_seconds + stmt.excluded.total_time_seconds,
+            "message_count": ChildTopicSummary.message_count + 1,
+            "last_accessed": now,
+            "updated_at": func.now()
+        }
+    )
+    await db.execute(stmt)
 
 
 def get_week_start(dt: datetime) -> date:
@@ -247,8 +257,8 @@ def get_week_start(dt: datetime) -> date:
     return (dt - timedelta(days=dt.weekday())).date()
 
 
-def get_child_insights_dashboard(
-    db: Session,
+async def get_child_insights_dashboard(
+    db: AsyncSession,
     child: Child
 ) -> ChildInsightsDashboard:
     """
@@ -261,10 +271,17 @@ def get_child_insights_dashboard(
     Returns:
         Complete insights dashboard
     """
-    # Get top 5 topics
-    top_topics_query = db.query(ChildTopicSummary).filter(
-        ChildTopicSummary.child_id == child.id
-    ).order_by(desc(ChildTopicSummary.total_time_seconds)).limit(5).all()
+    # Get top 5 topics; only columns carried by the covering index are read
+    top_topics_query = (await db.execute(
+        select(
+            ChildTopicSummary.topic,
+            ChildTopicSummary.total_time_seconds,
+            ChildTopicSummary.message_count,
+            ChildTopicSummary.last_accessed
+        ).where(
+            ChildTopicSummary.child_id == child.id
+        ).order_by(desc(ChildTopicSummary.total_time_seconds)).limit(5)
+    )).all()
 
     top_interests = [
         TopicInsight(
@@ -277,27 +294,27 @@ def get_child_insights_dashboard(
     ]
 
     # Get learning metrics
-    learning_metrics = calculate_learning_metrics(db, child.id)
+    learning_metrics = await calculate_learning_metrics(db, child.id)
 
     # Get weekly highlights
-    weekly_highlights = get_weekly_highlights(db, child.id)
-
-    # Get total sessions
-    total_sessions = db.query(func.count(ChatSession.id)).filter(
-        ChatSession.child_id == child.id
-    ).scalar() or 0
+    weekly_highlights = await get_weekly_highlights(db, child.id)
+
+    # Session count and last activity in one aggregate over chat_sessions;
+    # last_message_at is trigger-maintained from message inserts, so the
+    # latest one among sessions with messages is the last activity
+    total_sessions, last_activity = (await db.execute(
+        select(
+            func.count(ChatSession.id),
+            func.max(ChatSession.last_message_at).filter(ChatSession.message_count > 0)
+        ).where(ChatSession.child_id == child.id)
+    )).one()
 
     # Get total engagement time
-    total_time = db.query(func.sum(ChildTopicSummary.total_time_seconds)).filter(
-        ChildTopicSummary.child_id == child.id
-    ).scalar() or 0
-
-    # Get last activity
-    last_message = db.query(Message.created_at).join(ChatSession).filter(
-        ChatSession.child_id == child.id
-    ).order_by(desc(Message.created_at)).first()
-
-    last_activity = last_message[0] if last_message else None
+    total_time = (await db.execute(
+        select(func.sum(ChildTopicSummary.total_time_seconds)).where(
+            ChildTopicSummary.child_id == child.id
+        )
+    )).scalar() or 0
 
     return ChildInsightsDashboard(
         child_id=child.id,
@@ -311,7 +328,46 @@ def get_child_insights_dashboard(
     )
 
 
-def calculate_learning_metrics(db: Session, child_id: UUID) -> LearningMetrics:
+async def get_cached_child_insights_dashboard(
+    db: AsyncSession,
+    child: Child
+) -> ChildInsightsDashboard:
+    """
+    Get a child's insights dashboard, serving a recent copy when cached.
+
+    On a miss, unprocessed messages are folded into the insight tables
+    and the dashboard is recomputed and cached, so repeat views within
+    the TTL skip both the processing pass and the aggregate queries.
+
+    Args:
+        db: Database session
+        child: The child model
+
+    Returns:
+        Insights dashboard; generated_at tells how fresh it is
+    """
+    key = _dashboard_cache_key(child.id)
+    raw = await cache_get(key)
+    if raw is not None:
+        return ChildInsightsDashboard.model_validate_json(raw)
+
+    await process_existing_messages(db, child.id)
+    dashboard = await get_child_insights_dashboard(db, child)
+    await cache_set(key, dashboard.model_dump_json().encode(), INSIGHTS_DASHBOARD_TTL_SECONDS)
+    return dashboard
+
+
+async def invalidate_child_insights_dashboard(child_id: UUID) -> None:
+    """
+    Drop a child's cached dashboard so the next view recomputes it.
+
+    Args:
+        child_id: The child's ID
+    """
+    await cache_delete(_dashboard_cache_key(child_id))
+
+
+async def calculate_learning_metrics(db: AsyncSession, child_id: UUID) -> LearningMetrics:
     """
     Calculate learning behavior metrics for a child.
 
@@ -322,19 +378,19 @@ def calculate_learning_metrics(db: Session, child_id: UUID) -> LearningMetrics:
     Returns:
         Learning metrics including question types and streak
     """
-    # Get all insights for this child
-    insights_query = db.query(MessageInsight).join(
-        Message, MessageInsight.message_id == Message.id
-    ).join(
-        ChatSession, Message.session_id == ChatSession.id
-    ).filter(
-        ChatSession.child_id == child_id
-    )
-
-    total_questions = insights_query.count()
-    learning_questions = insights_query.filter(
-        MessageInsight.is_learning_question == True
-    ).count()
+    # Count all insights and the learning ones in a single pass
+    total_questions, learning_questions = (await db.execute(
+        select(
+            func.count(MessageInsight.id),
+            func.count(MessageInsight.id).filter(MessageInsight.is_learning_question == True)
+        ).join(
+            Message, MessageInsight.message_id == Message.id
+        ).join(
+            ChatSession, Message.session_id == ChatSession.id
+        ).where(
+            ChatSession.child_id == child_id
+        )
+    )).one()
 
     # Calculate percentage
     learning_percentage = 0.0
@@ -342,7 +398,7 @@ def calculate_learning_metrics(db: Session, child_id: UUID) -> LearningMetrics:
         learning_percentage = round((learning_questions / total_questions) * 100, 1)
 
     # Calculate learning streak (days with activity)
-    streak = calculate_learning_streak(db, child_id)
+    streak = await calculate_learning_streak(db, child_id)
 
     return LearningMetrics(
         total_questions=total_questions,
@@ -352,7 +408,7 @@ def calculate_learning_metrics(db: Session, child_id: UUID) -> LearningMetrics:
     )
 
 
-def calculate_learning_streak(db: Session, child_id: UUID) -> int:
+async def calculate_learning_streak(db: AsyncSession, child_id: UUID) -> int:
     """
     Calculate the number of consecutive days with learning activity.
 
@@ -364,13 +420,15 @@ def calculate_learning_streak(db: Session, child_id: UUID) -> int:
         Number of consecutive days
     """
     # Get unique dates with activity (ordered by date descending)
-    activity_dates = db.query(
-        func.date(Message.created_at).label('activity_date')
-    ).join(
-        ChatSession, Message.session_id == ChatSession.id
-    ).filter(
-        ChatSession.child_id == child_id
-    ).distinct().order_by(desc('activity_date')).all()
+    activity_dates = (await db.execute(
+        select(
+            func.date(Message.created_at).label('activity_date')
+        ).join(
+            ChatSession, Message.session_id == ChatSession.id
+        ).where(
+            ChatSession.child_id == child_id
+        ).distinct().order_by(desc('activity_date'))
+    )).all()
 
     if not activity_dates:
         return 0
@@ -394,7 +452,7 @@ def calculate_learning_streak(db: Session, child_id: UUID) -> int:
     return streak
 
 
-def get_weekly_highlights(db: Session, child_id: UUID) -> Optional[WeeklyHighlight]:
+async def get_weekly_highlights(db: AsyncSession, child_id: UUID) -> Optional[WeeklyHighlight]:
     """
     Get weekly highlights for a child.
 
@@ -409,19 +467,23 @@ def get_weekly_highlights(db: Session, child_id: UUID) -> Optional[WeeklyHighlig
     current_week_start = get_week_start(datetime.utcnow())
 
     # Check if we have cached weekly insights
-    cached = db.query(ChildWeeklyInsights).filter(
-        ChildWeeklyInsights.child_id == child_id,
-        ChildWeeklyInsights.week_start == current_week_start
-    ).first()
+    cached = (await db.execute(
+        select(ChildWeeklyInsights).where(
+            ChildWeeklyInsights.child_id == child_id,
+            ChildWeeklyInsights.week_start == current_week_start
+        )
+    )).scalars().first()
 
     if cached:
         # Convert cached data to WeeklyHighlight
         top_interests = []
         for topic_data in cached.top_topics[:2]:  # Top 2 for highlights
-            topic_summary = db.query(ChildTopicSummary).filter(
-                ChildTopicSummary.child_id == child_id,
-                ChildTopicSummary.topic == topic_data.get('topic')
-            ).first()
+            topic_summary = (await db.execute(
+                select(ChildTopicSummary).where(
+                    ChildTopicSummary.child_id == child_id,
+                    ChildTopicSummary.topic == topic_data.get('topic')
+                )
+            )).scalars().first()
 
             if topic_summary:
                 top_interests.append(TopicInsight(
@@ -446,11 +508,11 @@ def get_weekly_highlights(db: Session, child_id: UUID) -> Optional[WeeklyHighlig
         )
 
     # Generate weekly highlights on the fly
-    return generate_weekly_highlights(db, child_id, current_week_start)
+    return await generate_weekly_highlights(db, child_id, current_week_start)
 
 
-def generate_weekly_highlights(
-    db: Session,
+async def generate_weekly_highlights(
+    db: AsyncSession,
     child_id: UUID,
     week_start: date
 ) -> Optional[WeeklyHighlight]:
@@ -468,15 +530,17 @@ def generate_weekly_highlights(
     week_end = week_start + timedelta(days=7)
 
     # Get messages from this week
-    week_insights = db.query(MessageInsight).join(
-        Message, MessageInsight.message_id == Message.id
-    ).join(
-        ChatSession, Message.session_id == ChatSession.id
-    ).filter(
-        ChatSession.child_id == child_id,
-        Message.created_at >= datetime.combine(week_start, datetime.min.time()),
-        Message.created_at < datetime.combine(week_end, datetime.min.time())
-    ).all()
+    week_insights = (await db.execute(
+        select(MessageInsight).join(
+            Message, MessageInsight.message_id == Message.id
+        ).join(
+            ChatSession, Message.session_id == ChatSession.id
+        ).where(
+            ChatSession.child_id == child_id,
+            Message.created_at >= datetime.combine(week_start, datetime.min.time()),
+            Message.created_at < datetime.combine(week_end, datetime.min.time())
+        )
+    )).scalars().all()
 
     if not week_insights:
         return None
@@ -492,10 +556,12 @@ def generate_weekly_highlights(
     top_interests = []
 
     for topic, time_seconds in sorted_topics[:2]:
-        topic_summary = db.query(ChildTopicSummary).filter(
-            ChildTopicSummary.child_id == child_id,
-            ChildTopicSummary.topic == topic
-        ).first()
+        topic_summary = (await db.execute(
+            select(ChildTopicSummary).where(
+                ChildTopicSummary.child_id == child_id,
+                ChildTopicSummary.topic == topic
+            )
+        )).scalars().first()
 
         if topic_summary:
             top_interests.append(TopicInsight(
@@ -509,10 +575,12 @@ def generate_weekly_highlights(
     new_curiosity = None
     for insight in week_insights:
         if insight.topic:
-            topic_summary = db.query(ChildTopicSummary).filter(
-                ChildTopicSummary.child_id == child_id,
-                ChildTopicSummary.topic == insight.topic
-            ).first()
+            topic_summary = (await db.execute(
+                select(ChildTopicSummary).where(
+                    ChildTopicSummary.child_id == child_id,
+                    ChildTopicSummary.topic == insight.topic
+                )
+            )).scalars().first()
 
             if topic_summary and topic_summary.message_count <= 3:
                 # This might be a new curiosity
@@ -547,10 +615,13 @@ def generate_weekly_highlights(
     )
 
 
-def process_existing_messages(db: Session, child_id: UUID) -> int:
+async def process_existing_messages(db: AsyncSession, child_id: UUID) -> int:
     """
     Process existing messages that don't have insights yet.
 
+    Insights and topic totals are computed in memory and written back in
+    one multi-row INSERT each, rather than one round trip per message.
+
     Args:
         db: Database session
         child_id: The child's ID
@@ -558,29 +629,81 @@ def process_existing_messages(db: Session, child_id: UUID) -> int:
     Returns:
         Number of messages processed
     """
-    # Get unprocessed user messages
-    unprocessed = db.query(Message).join(
-        ChatSession, Message.session_id == ChatSession.id
-    ).outerjoin(
-        MessageInsight, Message.id == MessageInsight.message_id
-    ).filter(
-        ChatSession.child_id == child_id,
-        Message.role == MessageRole.USER,
-        Message.blocked == False,
-        MessageInsight.id == None
-    ).all()
-
-    processed_count = 0
-
-    for message in unprocessed:
-        # Find the next assistant message for response context
-        next_response = db.query(Message).filter(
-            Message.session_id == message.session_id,
-            Message.role == MessageRole.ASSISTANT,
-            Message.created_at > message.created_at
-        ).order_by(Message.created_at.asc()).first()
-
-        process_message_for_insights(db, message, next_response)
-        processed_count += 1
-
-    return processed_count
+    # First assistant reply after each user message, for engagement estimates
+    response_alias = aliased(Message)
+    next_response = select(response_alias.content).where(
+        response_alias.session_id == Message.session_id,
+        response_alias.role == MessageRole.ASSISTANT,
+        response_alias.created_at > Message.created_at
+    ).order_by(
+        response_alias.created_at.asc()
+    ).limit(1).correlate(Message).scalar_subquery()
+
+    # Get unprocessed user messages with their reply text in one query
+    unprocessed = (await db.execute(
+        select(Message.id, Message.content, next_response.label("response_content")).join(
+            ChatSession, Message.session_id == ChatSession.id
+        ).outerjoin(
+            MessageInsight, Message.id == MessageInsight.message_id
+        ).where(
+            ChatSession.child_id == child_id,
+            Message.role == MessageRole.USER,
+            Message.blocked == False,
+            MessageInsight.id == None
+        )
+    )).all()
+
+    if not unprocessed:
+        return 0
+
+    insight_rows = [
+        {
+            "message_id": row.id,
+            "topic": extract_topic(row.content),
+            "is_learning_question": is_learning_question(row.content),
+            "estimated_time_seconds": estimate_engagement_time(row.content, row.response_content or ""),
+        }
+        for row in unprocessed
+    ]
+
+    # One multi-row INSERT for all new insights. A per-message insight or
+    # another dashboard miss may have written some of these meanwhile, so
+    # skip those and only count the rows this call actually inserted.
+    stmt = insert(MessageInsight).values(insight_rows).on_conflict_do_nothing(
+        index_elements=[MessageInsight.message_id]
+    ).returning(MessageInsight.topic, MessageInsight.estimated_time_seconds)
+    inserted = (await db.execute(stmt)).all()
+
+    topic_totals: Dict[str, Tuple[int, int]] = {}
+    for row in inserted:
+        if row.topic:
+            total_time, count = topic_totals.get(row.topic, (0, 0))
+            topic_totals[row.topic] = (total_time + row.estimated_time_seconds, count + 1)
+
+    # Fold every touched topic into the summary with one multi-row upsert
+    if topic_totals:
+        now = datetime.utcnow()
+        stmt = insert(ChildTopicSummary).values([
+            {
+                "child_id": child_id,
+                "topic": topic,
+                "total_time_seconds": total_time,
+                "message_count": count,
+                "last_accessed": now,
+            }
+            for topic, (total_time, count) in topic_totals.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ChildTopicSummary.child_id, ChildTopicSummary.topic],
+            set_={
+                "total_time_seconds": ChildTopicSummary.total_time_seconds + stmt.excluded.total_time_seconds,
+                "message_count": ChildTopicSummary.message_count + stmt.excluded.message_count,
+                "last_accessed": now,
+                "updated_at": func.now()
+            }
+        )
+        await db.execute(stmt)
+
+    await db.commit()
+
+    return len(inserted)